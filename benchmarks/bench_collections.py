@@ -0,0 +1,160 @@
+"""Measure Python-style operations on large NSArrays and NSDictionaries.
+
+Mutating operations are compared against loops sending one message per element,
+which is how they were implemented before. Every measurement of a mutating operation
+includes making a mutable copy of the array to modify. The per-element deletion
+loop moves every later element on each removal, so it is only measured for the
+smaller sizes.
+"""
+
+from utils import report, timed
+
+from rubicon.objc import ns_from_py
+from rubicon.objc.runtime import autoreleasepool
+
+SIZES = [1_000, 100_000]
+MUTATION_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+LOOP_DELETION_MAX_SIZE = 100_000
+DICTIONARY_SIZES = [1_000, 100_000]
+
+
+def count(nsarray, value):
+    with autoreleasepool():
+        nsarray.count(value)
+
+
+def index(nsarray, value, start):
+    with autoreleasepool():
+        nsarray.index(value, start)
+
+
+def extended_slice(nsarray, step):
+    with autoreleasepool():
+        nsarray[::step]
+
+
+def extend(nsarray, values):
+    with autoreleasepool():
+        nsarray.mutableCopy().extend(values)
+
+
+def extend_loop(nsarray, values):
+    with autoreleasepool():
+        copy = nsarray.mutableCopy()
+        for value in values:
+            copy.addObject(value)
+
+
+def assign_every_other(nsarray, values):
+    with autoreleasepool():
+        nsarray.mutableCopy()[::2] = values
+
+
+def assign_every_other_loop(nsarray, values):
+    with autoreleasepool():
+        copy = nsarray.mutableCopy()
+        for index, value in zip(range(0, len(copy), 2), values, strict=True):
+            copy.replaceObjectAtIndex(index, withObject=value)
+
+
+def delete_every_other(nsarray):
+    with autoreleasepool():
+        del nsarray.mutableCopy()[::2]
+
+
+def delete_every_other_loop(nsarray):
+    with autoreleasepool():
+        copy = nsarray.mutableCopy()
+        for index in reversed(range(0, len(copy), 2)):
+            copy.removeObjectAtIndex(index)
+
+
+def update(nsdict, entries):
+    with autoreleasepool():
+        nsdict.mutableCopy().update(entries)
+
+
+def update_loop(nsdict, entries):
+    with autoreleasepool():
+        copy = nsdict.mutableCopy()
+        for key, value in entries.items():
+            copy.setObject(value, forKey=key)
+
+
+def pop_all(nsdict, keys):
+    with autoreleasepool():
+        copy = nsdict.mutableCopy()
+        for key in keys:
+            copy.pop(key)
+
+
+def main():
+    for size in SIZES:
+        nsarray = ns_from_py([f"item {i % 100}" for i in range(size)])
+        report(f"count, {size} items", timed(count, nsarray, "item 42"))
+        report(
+            f"index from the middle, {size} items",
+            timed(index, nsarray, "item 42", size // 2),
+        )
+        for step in [2, -2, 1000]:
+            report(
+                f"slice with step {step}, {size} items",
+                timed(extended_slice, nsarray, step),
+            )
+
+    for size in MUTATION_SIZES:
+        with autoreleasepool():
+            nsarray = ns_from_py([f"item {i}" for i in range(size)])
+            values = [f"value {i}" for i in range((size + 1) // 2)]
+            report(
+                f"extend, {size} items", timed(extend, nsarray, values, repeat=3), size
+            )
+            report(
+                f"extend, loop, {size} items",
+                timed(extend_loop, nsarray, values, repeat=3),
+                size,
+            )
+            report(
+                f"assign [::2], {size} items",
+                timed(assign_every_other, nsarray, values, repeat=3),
+                size,
+            )
+            report(
+                f"assign [::2], loop, {size} items",
+                timed(assign_every_other_loop, nsarray, values, repeat=3),
+                size,
+            )
+            report(
+                f"delete [::2], {size} items",
+                timed(delete_every_other, nsarray, repeat=3),
+                size,
+            )
+            if size <= LOOP_DELETION_MAX_SIZE:
+                report(
+                    f"delete [::2], loop, {size} items",
+                    timed(delete_every_other_loop, nsarray, repeat=3),
+                    size,
+                )
+
+    for size in DICTIONARY_SIZES:
+        with autoreleasepool():
+            entries = {f"key {i}": f"value {i}" for i in range(size)}
+            nsdict = ns_from_py(dict(list(entries.items())[: size // 2]))
+            report(
+                f"update, {size} items", timed(update, nsdict, entries, repeat=3), size
+            )
+            report(
+                f"update, loop, {size} items",
+                timed(update_loop, nsdict, entries, repeat=3),
+                size,
+            )
+            keys = list(entries)[: size // 2]
+            report(
+                f"pop, {size // 2} items",
+                timed(pop_all, nsdict, keys, repeat=3),
+                len(keys),
+            )
+
+
+if __name__ == "__main__":
+    main()
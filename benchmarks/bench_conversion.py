@@ -0,0 +1,110 @@
+"""Measure converting large Python collections to and from Foundation objects."""
+
+import array
+
+from utils import report, timed
+
+from rubicon.objc import ns_from_py, py_from_ns
+from rubicon.objc.api import ns_from_py_array, py_array_from_ns
+from rubicon.objc.runtime import autoreleasepool
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def payload(size):
+    """A JSON-like payload: a list of small records."""
+    return [
+        {"id": i, "name": f"item {i}", "price": i * 0.5, "tags": ["a", "b"]}
+        for i in range(size // 10)
+    ] + list(range(size - size // 10))
+
+
+def numbers(size):
+    """A numeric array, mixing integers, floats and booleans."""
+    return [(i, i * 0.5, i % 2 == 0)[i % 3] for i in range(size)]
+
+
+def to_foundation(pyobj):
+    with autoreleasepool():
+        ns_from_py(pyobj)
+
+
+def round_trip(nsobj):
+    with autoreleasepool():
+        py_from_ns(nsobj)
+
+
+def samples(size):
+    """A typed array of sensor readings."""
+    return array.array("d", (i * 0.25 for i in range(size)))
+
+
+def to_foundation_array(buffer, packed):
+    with autoreleasepool():
+        ns_from_py_array(buffer, packed=packed)
+
+
+def to_python_array(nsobj, typecode):
+    with autoreleasepool():
+        py_array_from_ns(nsobj, typecode)
+
+
+def config(size):
+    """A flat settings dictionary, as loaded from a property list."""
+    return {f"key {i}": (f"value {i}", i, i * 0.5)[i % 3] for i in range(size)}
+
+
+def compare(nsobj, pyobj):
+    with autoreleasepool():
+        nsobj == pyobj  # noqa: B015
+
+
+def iterate_view(nsobj):
+    with autoreleasepool():
+        for _ in nsobj.py_view().items():
+            pass
+
+
+def main():
+    for size in SIZES:
+        pyobj = payload(size)
+        report(f"ns_from_py, {size} items", timed(to_foundation, pyobj, repeat=3))
+        nsobj = ns_from_py(pyobj)
+        report(f"py_from_ns, {size} items", timed(round_trip, nsobj, repeat=3))
+        nsobj = ns_from_py(numbers(size))
+        report(f"py_from_ns, {size} numbers", timed(round_trip, nsobj, repeat=3))
+
+        buffer = samples(size)
+        report(
+            f"ns_from_py(list), {size} doubles",
+            timed(to_foundation, buffer.tolist(), repeat=3),
+        )
+        report(
+            f"ns_from_py_array, {size} doubles",
+            timed(to_foundation_array, buffer, False, repeat=3),
+        )
+        report(
+            f"ns_from_py_array(packed=True), {size} doubles",
+            timed(to_foundation_array, buffer, True, repeat=3),
+        )
+        pyobj = config(size)
+        nsobj = ns_from_py(pyobj)
+        report(f"NSDictionary == dict, {size} items", timed(compare, nsobj, pyobj))
+        smaller = dict(list(pyobj.items())[1:])
+        report(
+            f"NSDictionary == dict, {size} items, different lengths",
+            timed(compare, nsobj, smaller),
+        )
+        report(f"py_view().items(), {size} items", timed(iterate_view, nsobj))
+
+        nsobj = ns_from_py_array(buffer)
+        report(f"py_from_ns, {size} doubles", timed(round_trip, nsobj, repeat=3))
+        for typecode in [None, "d"]:
+            report(
+                f"py_array_from_ns(typecode={typecode!r}), {size} doubles",
+                timed(to_python_array, nsobj, typecode, repeat=3),
+            )
+
+
+if __name__ == "__main__":
+    main()
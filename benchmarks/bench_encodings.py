@@ -0,0 +1,172 @@
+"""Measure parsing Objective-C method type encodings.
+
+Unlike the other benchmarks, this one doesn't need macOS. It loads
+rubicon.objc.types on its own, without the rest of the package (which needs the
+Objective-C runtime), so it can be run on any platform:
+
+    $ python benchmarks/bench_encodings.py
+"""
+
+import importlib.util
+import os
+from ctypes import c_void_p
+
+from utils import python_description, report, timed
+
+# Method type encodings from Foundation and AppKit, as returned by
+# method_getTypeEncoding on arm64 macOS.
+ENCODINGS = [
+    b"v16@0:8",
+    b"@16@0:8",
+    b"B16@0:8",
+    b"Q16@0:8",
+    b"q16@0:8",
+    b"d16@0:8",
+    b"f16@0:8",
+    b"#16@0:8",
+    b"r*16@0:8",
+    b"^v16@0:8",
+    b"v24@0:8@16",
+    b"v24@0:8Q16",
+    b"v24@0:8q16",
+    b"v20@0:8B16",
+    b"v24@0:8d16",
+    b"v20@0:8f16",
+    b"@24@0:8@16",
+    b"@24@0:8Q16",
+    b"@24@0:8:16",
+    b"B24@0:8@16",
+    b"B24@0:8:16",
+    b"@24@0:8r*16",
+    b"v32@0:8@16@24",
+    b"v32@0:8@16Q24",
+    b"@32@0:8@16@24",
+    b"@32@0:8@16Q24",
+    b"@32@0:8Q16@24",
+    b"B32@0:8@16^@24",
+    b"v40@0:8@16@24@32",
+    b"@40@0:8@16@24^@32",
+    b"@40@0:8:16@24@32",
+    b"v48@0:8@16@24@32@40",
+    b"@28@0:8r^v16I24",
+    b"@32@0:8r^v16Q24",
+    b"@40@0:8^v16Q24Q32B40",
+    b"Q32@0:8^{_NSRange=QQ}16Q24",
+    b"{_NSRange=QQ}16@0:8",
+    b"{_NSRange=QQ}32@0:8@16Q24",
+    b"{_NSRange=QQ}48@0:8@16Q24{_NSRange=QQ}32",
+    b"v32@0:8{_NSRange=QQ}16",
+    b"@32@0:8{_NSRange=QQ}16",
+    b"v48@0:8^S16{_NSRange=QQ}24^{_NSRange=QQ}40",
+    b"{CGPoint=dd}16@0:8",
+    b"{CGSize=dd}16@0:8",
+    b"{CGRect={CGPoint=dd}{CGSize=dd}}16@0:8",
+    b"v32@0:8{CGPoint=dd}16",
+    b"v32@0:8{CGSize=dd}16",
+    b"v48@0:8{CGRect={CGPoint=dd}{CGSize=dd}}16",
+    b"@48@0:8{CGRect={CGPoint=dd}{CGSize=dd}}16",
+    b"@56@0:8{CGRect={CGPoint=dd}{CGSize=dd}}16Q48",
+    b"{CGRect={CGPoint=dd}{CGSize=dd}}56@0:8{CGRect={CGPoint=dd}{CGSize=dd}}16@48",
+    b"{CGPoint=dd}40@0:8{CGPoint=dd}16@32",
+    b"v64@0:8{CGRect={CGPoint=dd}{CGSize=dd}}16@48@56",
+    b"{NSEdgeInsets=dddd}16@0:8",
+    b"v48@0:8{NSEdgeInsets=dddd}16",
+    b"{CGAffineTransform=dddddd}16@0:8",
+    b"v24@0:8@?16",
+    b"v32@0:8@16@?24",
+    b"v32@0:8@?<v@?@>16@24",
+    b"v40@0:8Q16@24@?<v@?@@>32",
+    b"@32@0:8@?<q@?@@>16@24",
+    b"@24@0:8^{_NSZone=}16",
+    b"^{__CFString=}16@0:8",
+    b"^{CGColor=}16@0:8",
+    b"v24@0:8^{CGColor=}16",
+    b"^{CGContext=}16@0:8",
+    b"v24@0:8^{CGImage=}16",
+    b'@"NSString"16@0:8',
+    b'v24@0:8@"NSString"16',
+    b'@"NSArray"24@0:8@"NSString"16',
+    b"v24@0:8r^{_NSRange=QQ}16",
+    b"B40@0:8@16^@24^@32",
+    b"@36@0:8@16B24^@28",
+    b"v44@0:8@16@24B32@36",
+    b"c16@0:8",
+    b"C16@0:8",
+    b"s16@0:8",
+    b"S16@0:8",
+    b"i16@0:8",
+    b"I16@0:8",
+    b"l16@0:8",
+    b"L16@0:8",
+]
+
+# A large framework class has thousands of methods, but only a few hundred distinct
+# signatures. The corpus repeats each signature to model this.
+CORPUS = ENCODINGS * 50
+
+
+def load_types():
+    """Load rubicon.objc.types without importing the rest of the package."""
+    path = os.path.join(
+        os.path.dirname(__file__), os.pardir, "src", "rubicon", "objc", "types.py"
+    )
+    spec = importlib.util.spec_from_file_location("rubicon_objc_types", path)
+    types = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(types)
+
+    # rubicon.objc.runtime registers the Objective-C object types. Register
+    # stand-ins for them, so that the encodings above can be parsed.
+    for encoding in [b"@", b"@?", b"#", b":"]:
+        types.register_encoding(
+            encoding, type(f"stand_in_{encoding!r}", (c_void_p,), {})
+        )
+
+    return types
+
+
+def split(types, corpus):
+    for encoding in corpus:
+        types.split_method_encoding(encoding)
+
+
+def parse_uncached(types, corpus):
+    for encoding in corpus:
+        [types.ctype_for_encoding(enc) for enc in types.split_method_encoding(encoding)]
+
+
+def parse_cold(types, corpus):
+    types._ctypes_for_method_encoding.cache_clear()
+    for encoding in corpus:
+        types.ctypes_for_method_encoding(encoding)
+
+
+def parse_warm(types, corpus):
+    for encoding in corpus:
+        types.ctypes_for_method_encoding(encoding)
+
+
+def main():
+    types = load_types()
+    # Parse every encoding once, so that all structure types have been created.
+    parse_warm(types, ENCODINGS)
+
+    print(python_description())
+    print(f"{len(CORPUS)} encodings, {len(ENCODINGS)} distinct")
+    report("split_method_encoding", timed(split, types, CORPUS), len(CORPUS))
+    report(
+        "split and convert, uncached", timed(parse_uncached, types, CORPUS), len(CORPUS)
+    )
+    report(
+        "ctypes_for_method_encoding, cold",
+        timed(parse_cold, types, CORPUS),
+        len(CORPUS),
+    )
+    report(
+        "ctypes_for_method_encoding, warm",
+        timed(parse_warm, types, CORPUS),
+        len(CORPUS),
+    )
+
+
+if __name__ == "__main__":
+    main()
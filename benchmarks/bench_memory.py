@@ -0,0 +1,123 @@
+"""Measure the memory used by the method caches of a large class hierarchy.
+
+Every AppKit view and control class below is wrapped, and a set of commonly used
+method names is resolved on each of them, as an app that shows these views would do.
+The memory allocated by Python while doing so is reported per class, followed by the
+size of the bound method objects created for every method call.
+"""
+
+import tracemalloc
+
+from utils import python_description
+
+from rubicon.objc import NSObject, ObjCClass
+from rubicon.objc.runtime import load_library
+
+CLASS_NAMES = [
+    "NSResponder",
+    "NSView",
+    "NSControl",
+    "NSButton",
+    "NSPopUpButton",
+    "NSTextField",
+    "NSSecureTextField",
+    "NSSearchField",
+    "NSComboBox",
+    "NSSlider",
+    "NSStepper",
+    "NSSegmentedControl",
+    "NSDatePicker",
+    "NSImageView",
+    "NSLevelIndicator",
+    "NSProgressIndicator",
+    "NSTableView",
+    "NSOutlineView",
+    "NSBrowser",
+    "NSScrollView",
+    "NSClipView",
+    "NSTextView",
+    "NSStackView",
+    "NSSplitView",
+    "NSTabView",
+    "NSBox",
+    "NSVisualEffectView",
+    "NSWindow",
+    "NSPanel",
+    "NSViewController",
+    "NSWindowController",
+]
+
+# Full method names, partial method names and property names.
+ATTRIBUTE_NAMES = [
+    "init",
+    "initWithFrame",
+    "initWithFrame_",
+    "frame",
+    "setFrame_",
+    "bounds",
+    "superview",
+    "subviews",
+    "addSubview",
+    "addSubview_",
+    "removeFromSuperview",
+    "window",
+    "isHidden",
+    "setHidden_",
+    "setNeedsDisplay_",
+    "layout",
+    "description",
+    "isEqual",
+    "respondsToSelector",
+    "performSelector",
+    "setTarget_",
+    "setAction_",
+    "stringValue",
+    "setStringValue_",
+]
+
+BOUND_METHODS = 10_000
+
+
+def load_classes():
+    """Wrap every class, and resolve each attribute name on it."""
+    classes = [ObjCClass(name) for name in CLASS_NAMES]
+    for cls in classes:
+        for name in ATTRIBUTE_NAMES:
+            cls._resolve_attribute(name)
+    return classes
+
+
+def bound_methods(obj):
+    return [obj.respondsToSelector for _ in range(BOUND_METHODS)]
+
+
+def report_bytes(name, size):
+    print(f"{name:<50} {size:10,.0f} bytes")
+
+
+def main():
+    load_library("AppKit")
+    # Wrap NSObject and resolve the names on it first, so that the measurement
+    # doesn't include anything cached globally, like selectors and method signatures.
+    for name in ATTRIBUTE_NAMES:
+        NSObject._resolve_attribute(name)
+
+    print(python_description())
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    classes = load_classes()
+    size = tracemalloc.get_traced_memory()[0] - start
+    report_bytes(f"{len(classes)} classes, per class", size / len(classes))
+
+    obj = NSObject.new()
+    obj.respondsToSelector  # noqa: B018
+    start = tracemalloc.get_traced_memory()[0]
+    methods = bound_methods(obj)
+    size = tracemalloc.get_traced_memory()[0] - start
+    report_bytes("ObjCBoundMethod, per object", size / len(methods))
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
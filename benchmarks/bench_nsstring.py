@@ -0,0 +1,69 @@
+"""Measure converting strings between Python and NSString, across string sizes and
+scripts."""
+
+from utils import report, timed
+
+from rubicon.objc import ns_from_py
+from rubicon.objc.runtime import autoreleasepool
+
+ITERATIONS = 10_000
+
+SCRIPTS = {
+    "ASCII": "request handled ",
+    "Latin-1": "Grüße, señor ",
+    "CJK": "你好，世界 ",
+    "emoji": "ok 👍 ",
+}
+
+SIZES = [16, 1_000, 1_000_000]
+
+
+def strings():
+    """Yield `(name, str)` pairs for every combination of script and size."""
+    for script, text in SCRIPTS.items():
+        for size in SIZES:
+            yield f"{script}, {size:,} chars", (text * (size // len(text) + 1))[:size]
+
+
+def iterations_for(pystr):
+    return ITERATIONS if len(pystr) < 10_000 else 10
+
+
+def to_foundation(pystr, iterations, no_copy):
+    with autoreleasepool():
+        for _ in range(iterations):
+            ns_from_py(pystr, no_copy=no_copy)
+
+
+def to_python(nsstr, iterations):
+    for _ in range(iterations):
+        str(nsstr)
+
+
+def main():
+    for name, pystr in strings():
+        iterations = iterations_for(pystr)
+        report(
+            f"ns_from_py(str), {name}",
+            timed(to_foundation, pystr, iterations, False),
+            iterations,
+        )
+        report(
+            f"ns_from_py(str, no_copy=True), {name}",
+            timed(to_foundation, pystr, iterations, True),
+            iterations,
+        )
+
+    with autoreleasepool():
+        for name, pystr in strings():
+            iterations = iterations_for(pystr)
+            nsstr = ns_from_py(pystr)
+            report(
+                f"str(NSString), {name}",
+                timed(to_python, nsstr, iterations),
+                iterations,
+            )
+
+
+if __name__ == "__main__":
+    main()
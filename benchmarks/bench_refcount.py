@@ -0,0 +1,64 @@
+"""Measure wrapping Objective-C objects in ObjCInstance and dropping the wrappers.
+
+Every wrapper retains its object when it is created, and autoreleases it when it is
+garbage collected. For comparison, the same reference count operations are also timed
+when sent as messages.
+"""
+
+from utils import python_description, report, timed
+
+from rubicon.objc import NSObject, ObjCInstance
+from rubicon.objc.runtime import autoreleasepool, objc_id, send_message
+
+OBJECTS = 1_000_000
+
+
+def create_objects(count):
+    """Create `count` objects, without wrapping them."""
+    return [
+        send_message(NSObject, "new", restype=objc_id, argtypes=[])
+        for _ in range(count)
+    ]
+
+
+def release_objects(ptrs):
+    for ptr in ptrs:
+        send_message(ptr, "release", restype=None, argtypes=[])
+
+
+def wrap_and_drop(ptrs):
+    with autoreleasepool():
+        for ptr in ptrs:
+            ObjCInstance(ptr)
+
+
+def wrap_and_keep(ptrs):
+    with autoreleasepool():
+        wrappers = [ObjCInstance(ptr) for ptr in ptrs]
+        del wrappers
+
+
+def send_retain_autorelease(ptrs):
+    with autoreleasepool():
+        for ptr in ptrs:
+            send_message(ptr, "retain", restype=objc_id, argtypes=[])
+            send_message(ptr, "autorelease", restype=objc_id, argtypes=[])
+
+
+def main():
+    print(python_description())
+    ptrs = create_objects(OBJECTS)
+    try:
+        report("wrap and drop", timed(wrap_and_drop, ptrs, repeat=3), OBJECTS)
+        report("wrap all, then drop", timed(wrap_and_keep, ptrs, repeat=3), OBJECTS)
+        report(
+            "send retain and autorelease",
+            timed(send_retain_autorelease, ptrs, repeat=3),
+            OBJECTS,
+        )
+    finally:
+        release_objects(ptrs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Measure how method and property access, and wrapping objects, scale across
+threads.
+
+The scenarios are the same as in tests/test_threads.py, but with warm caches: every
+thread repeatedly calls a method, reads a property and writes a property on a shared
+object. Every thread also wraps a shared set of objects, both while the objects are
+already wrapped (so that the existing wrappers are reused), and while they aren't (so
+that every wrapper is created and dropped again). On free-threaded Python builds, the
+throughput should grow with the number of threads, since cache hits don't take any
+locks.
+"""
+
+import threading
+import time
+
+from utils import load_test_harness, python_description, report
+
+from rubicon.objc import ObjCClass, ObjCInstance
+from rubicon.objc.runtime import autoreleasepool, objc_id, send_message
+
+ITERATIONS = 20_000
+THREAD_COUNTS = [1, 2, 4, 8]
+
+
+def call_method(obj):
+    for _ in range(ITERATIONS):
+        obj.mutateIntFieldWithValue(42)
+
+
+def get_property(obj):
+    for _ in range(ITERATIONS):
+        obj.intField  # noqa: B018
+
+
+def set_property(obj):
+    for _ in range(ITERATIONS):
+        obj.intField = 42
+
+
+def wrap_objects(ptrs):
+    with autoreleasepool():
+        for ptr in ptrs:
+            ObjCInstance(ptr)
+
+
+def run_threads(work, obj, thread_count):
+    """Run `work(obj)` on `thread_count` threads at once, and return the elapsed
+    time."""
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker():
+        barrier.wait()
+        work(obj)
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    load_test_harness()
+    Example = ObjCClass("Example")
+    obj = Example.alloc().init()
+
+    print(python_description())
+    for work in [call_method, get_property, set_property]:
+        # Warm up the caches.
+        work(obj)
+        for thread_count in THREAD_COUNTS:
+            elapsed = run_threads(work, obj, thread_count)
+            report(
+                f"{work.__name__}, {thread_count} thread(s)",
+                elapsed,
+                ITERATIONS * thread_count,
+            )
+
+    ptrs = [
+        send_message(Example, "new", restype=objc_id, argtypes=[])
+        for _ in range(ITERATIONS)
+    ]
+    for cached in [False, True]:
+        # While wrappers exist, wrapping the objects again reuses them.
+        wrappers = [ObjCInstance(ptr) for ptr in ptrs] if cached else None
+        name = "wrap_objects, cached" if cached else "wrap_objects, uncached"
+        for thread_count in THREAD_COUNTS:
+            elapsed = run_threads(wrap_objects, ptrs, thread_count)
+            report(
+                f"{name}, {thread_count} thread(s)", elapsed, ITERATIONS * thread_count
+            )
+        del wrappers
+
+    for ptr in ptrs:
+        send_message(ptr, "release", restype=None, argtypes=[])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Helpers shared by the benchmark scripts."""
+
+import os
+import sys
+import time
+
+
+def load_test_harness():
+    """Load the Rubicon test harness library, so that classes like `Example` are
+    available.
+
+    The harness must have been built with `make -C tests/objc`.
+    """
+    from rubicon.objc.runtime import load_library
+
+    return load_library(
+        os.path.join(
+            os.path.dirname(__file__),
+            os.pardir,
+            "tests",
+            "objc",
+            "build",
+            "librubiconharness.dylib",
+        )
+    )
+
+
+def python_description():
+    """A short description of the running Python, noting free-threaded builds."""
+    version = ".".join(str(part) for part in sys.version_info[:3])
+    if getattr(sys, "_is_gil_enabled", lambda: True)():
+        return f"Python {version}"
+    else:
+        return f"Python {version} (free-threaded)"
+
+
+def timed(func, *args, repeat=5):
+    """Call `func(*args)` `repeat` times and return the fastest wall clock time, in
+    seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(name, seconds, operations=None):
+    """Print the result of a single measurement."""
+    if operations is None:
+        print(f"{name:<50} {seconds * 1000:10.2f} ms")
+    else:
+        rate = operations / seconds
+        print(f"{name:<50} {seconds * 1000:10.2f} ms {rate:14,.0f} ops/s")
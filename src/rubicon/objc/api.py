@@ -1,3 +1,5 @@
+import array
+import codecs
 import collections.abc
 import decimal
 import enum
@@ -8,20 +10,31 @@ import weakref
 from ctypes import (
     CFUNCTYPE,
     POINTER,
+    ArgumentError,
     Array,
     Structure,
     Union,
+    _Pointer,
+    _SimpleCData,
     addressof,
     byref,
     c_bool,
     c_char_p,
+    c_double,
+    c_float,
     c_int,
+    c_long,
+    c_longlong,
+    c_ssize_t,
     c_uint,
     c_uint8,
+    c_uint32,
     c_ulong,
+    c_ulonglong,
     c_void_p,
     cast,
     py_object,
+    pythonapi,
     sizeof,
     string_at,
 )
@@ -29,6 +42,10 @@ from ctypes import (
 from .runtime import (
     SEL,
     Class,
+    _add_method_hooks,
+    _annotate_argument_error,
+    _defer_release,
+    _msg_send_for_types,
     add_ivar,
     add_method,
     ensure_bytes,
@@ -36,6 +53,7 @@ from .runtime import (
     get_ivar,
     libc,
     libobjc,
+    load_library,
     objc_block,
     objc_id,
     objc_property_attribute_t,
@@ -45,11 +63,15 @@ from .runtime import (
     set_ivar,
 )
 from .types import (
+    CFIndex,
+    NSRange,
+    NSUInteger,
     compound_value_for_sequence,
     ctype_for_type,
     ctypes_for_method_encoding,
     encoding_for_ctype,
     register_ctype_for_type,
+    unichar,
 )
 
 __all__ = [
@@ -71,18 +93,24 @@ __all__ = [
     "ObjCProtocol",
     "Protocol",
     "at",
+    "converter_for_objcclass",
     "for_objcclass",
+    "get_converter_for_objcclass_map",
     "get_type_for_objcclass_map",
     "ns_from_py",
+    "ns_from_py_array",
     "objc_classmethod",
     "objc_const",
     "objc_ivar",
     "objc_method",
     "objc_property",
     "objc_rawmethod",
+    "py_array_from_ns",
     "py_from_ns",
+    "register_converter_for_objcclass",
     "register_type_for_objcclass",
     "type_for_objcclass",
+    "unregister_converter_for_objcclass",
     "unregister_type_for_objcclass",
 ]
 
@@ -91,11 +119,47 @@ __all__ = [
 # the Python objects are not destroyed if they are otherwise no Python references left.
 _keep_alive_objects = {}
 
+# The ObjCClass objects of each class and all of its subclasses that have been
+# created, keyed by the class address, so that only the caches of the affected
+# classes are invalidated when a method is added to a class or a property is declared.
+_objc_class_descendants = {}
+
+# Kinds of attribute resolutions stored in ObjCClass.resolved_attributes.
+_ATTR_PROPERTY = "property"
+_ATTR_METHOD = "method"
+_ATTR_PARTIAL_METHOD = "partial method"
+_ATTR_ASSOCIATED = "associated"
+
 # Methods that return an object which is implicitly retained by the caller.
 # See https://clang.llvm.org/docs/AutomaticReferenceCounting.html#semantics-of-method-families.
 _RETURNS_RETAINED_FAMILIES = {"init", "alloc", "new", "copy", "mutableCopy"}
 
 
+def _set_associated_py_object(obj, key, value):
+    """Store a Python object as an associated object of an Objective-C object.
+
+    The Python object is wrapped in a WrappedPyObject, so a reference to it is kept
+    until the association is replaced or the Objective-C object is deallocated. Any
+    previous associated object with the same key is released.
+    """
+    wrapper = send_message(
+        send_message(
+            get_class("WrappedPyObject"),
+            "alloc",
+            restype=objc_id,
+            argtypes=[],
+        ),
+        "initWithObjectId:",
+        id(value),
+        restype=objc_id,
+        argtypes=[objc_id],
+    )
+    libobjc.objc_setAssociatedObject(obj, key, wrapper, 0x301)
+
+    # Release the wrapper object, it will be retained by the association.
+    send_message(wrapper, "release", restype=objc_id, argtypes=[])
+
+
 def get_method_family(method_name: str) -> str:
     """Returns the method family from the method name.
 
@@ -175,6 +239,22 @@ class ObjCMethod:
     ///
     """
 
+    # A wrapper is created for every method that is called, so instances are kept
+    # small.
+    __slots__ = (
+        "_arg_converters",
+        "_method_family",
+        "_returns_object",
+        "_returns_retained",
+        "_send",
+        "encoding",
+        "imp_argtypes",
+        "method_argtypes",
+        "name",
+        "restype",
+        "selector",
+    )
+
     def __init__(self, method):
         """The constructor takes a [`Method`][rubicon.objc.runtime.Method] object, whose
         information is used to create an [`ObjCMethod`][rubicon.objc.api.ObjCMethod].
@@ -189,6 +269,19 @@ class ObjCMethod:
         assert self.imp_argtypes[:2] == [objc_id, SEL]
         self.method_argtypes = self.imp_argtypes[2:]
 
+        # Everything that only depends on the method signature is worked out once
+        # here, so that calls only need to run the argument converters and the
+        # preconfigured objc_msgSend function.
+        self._arg_converters = tuple(
+            _arg_converter_for_argtype(argtype) for argtype in self.method_argtypes
+        )
+        self._method_family = get_method_family(self.name.decode())
+        self._returns_retained = self._method_family in _RETURNS_RETAINED_FAMILIES
+        self._returns_object = self.restype is not None and issubclass(
+            self.restype, objc_id
+        )
+        self._send = _msg_send_for_types(self.restype, self.method_argtypes)
+
     def __repr__(self):
         return (
             f"<{type(self).__qualname__}: {self.name.decode()} "
@@ -228,45 +321,35 @@ class ObjCMethod:
         --- the method's `selector` is automatically added between the
         receiver and the method arguments.
         """
-        if len(args) != len(self.method_argtypes):
+        if len(args) != len(self._arg_converters):
             raise TypeError(
-                f"Method {self.name} takes {len(args)} arguments, but got "
-                f"{len(self.method_argtypes)} arguments"
+                f"Method {self.name} takes {len(self._arg_converters)} arguments, "
+                f"but got {len(args)} arguments"
             )
 
         if convert_args:
             converted_args = []
-            for argtype, arg in zip(self.method_argtypes, args, strict=True):
+            for convert, arg in zip(self._arg_converters, args, strict=True):
                 if isinstance(arg, enum.Enum):
                     # Convert Python enum objects to their values
                     arg = arg.value
-
-                if issubclass(argtype, objc_block):
-                    if arg is None:
-                        # allow for 'nil' block args, which some objc methods accept
-                        arg = ns_from_py(arg)
-                    elif callable(arg) and not isinstance(
-                        arg, Block
-                    ):  # <-- guard against someone someday making Block callable
-                        # Note: We need to keep the temp. Block instance
-                        # around at least until the objc method is called.
-                        # _as_parameter_ is used in the actual ctypes marshalling below.
-                        arg = Block(arg)
-                    # ^ For blocks at this point either arg is a Block instance
-                    # (making use of _as_parameter_), is None, or if it isn't either of
-                    # those two, an ArgumentError will be raised below.
-                elif issubclass(argtype, objc_id):
-                    # Convert Python objects to Foundation objects
-                    arg = ns_from_py(arg)
-                elif isinstance(arg, collections.abc.Sequence) and issubclass(
-                    argtype, (Structure, Array)
-                ):
-                    arg = compound_value_for_sequence(arg, argtype)
-
+                if convert is not None:
+                    arg = convert(arg)
                 converted_args.append(arg)
         else:
             converted_args = args
 
+        try:
+            receiver_ptr = receiver._as_parameter_
+        except AttributeError:
+            receiver_ptr = receiver
+
+        if not isinstance(receiver_ptr, objc_id):
+            raise TypeError(
+                f"Receiver must be an ObjCInstance or objc_id, "
+                f"not {type(receiver).__module__}.{type(receiver).__qualname__}"
+            )
+
         # Init methods consume their `self` argument (the receiver), see
         # https://clang.llvm.org/docs/AutomaticReferenceCounting.html#semantics-of-init.
         # To ensure the receiver pointer remains valid if `init` does not return `self`
@@ -274,17 +357,17 @@ class ObjCMethod:
         # be done before calling the method.
         # Note that if `init` does return the same object, it will already be in our
         # cache and balanced with a `release` on cache retrieval.
-        method_family = get_method_family(self.name.decode())
-        if method_family == "init":
-            send_message(receiver, "retain", restype=objc_id, argtypes=[])
-
-        result = send_message(
-            receiver,
-            self.selector,
-            *converted_args,
-            restype=self.restype,
-            argtypes=self.method_argtypes,
-        )
+        if self._method_family == "init":
+            libobjc.objc_retain(receiver_ptr)
+
+        try:
+            result = self._send(receiver_ptr, self.selector, *converted_args)
+        except ArgumentError as error:
+            _annotate_argument_error(error, self.selector, self.method_argtypes)
+            raise
+
+        if self.restype == c_void_p:
+            result = c_void_p(result)
 
         if not convert_result:
             return result
@@ -292,28 +375,86 @@ class ObjCMethod:
         # Convert result to python type if it is an instance or class pointer.
         # Explicitly retain the instance on first handover to Python unless we
         # received it from a method that gives us ownership already.
-        if self.restype is not None and issubclass(self.restype, objc_id):
-            implicitly_owned = method_family in _RETURNS_RETAINED_FAMILIES
-            result = ObjCInstance(result, _implicitly_owned=implicitly_owned)
+        if self._returns_object:
+            result = ObjCInstance(result, _implicitly_owned=self._returns_retained)
 
         return result
 
 
+def _convert_block_arg(arg):
+    """Argument converter for parameters that expect a block."""
+    if arg is None:
+        # allow for 'nil' block args, which some objc methods accept
+        return ns_from_py(arg)
+    elif callable(arg) and not isinstance(arg, Block):
+        # The isinstance check guards against someone someday making Block callable.
+        # Note: We need to keep the temp. Block instance around at least until the
+        # objc method is called. _as_parameter_ is used in the actual ctypes
+        # marshalling.
+        return Block(arg)
+    # For blocks at this point either arg is a Block instance (making use of
+    # _as_parameter_), or if it isn't, an ArgumentError will be raised by ctypes.
+    return arg
+
+
+def _arg_converter_for_argtype(argtype):
+    """Return the function used by [`ObjCMethod`][rubicon.objc.api.ObjCMethod] to
+    convert arguments for a parameter of the given type, or `None` if only the default
+    [`ctypes`][] conversions apply."""
+    if issubclass(argtype, objc_block):
+        return _convert_block_arg
+    elif issubclass(argtype, objc_id):
+        # Convert Python objects to Foundation objects
+        return ns_from_py
+    elif issubclass(argtype, (Structure, Array)):
+
+        def convert_compound_arg(arg):
+            if isinstance(arg, collections.abc.Sequence):
+                return compound_value_for_sequence(arg, argtype)
+            return arg
+
+        return convert_compound_arg
+    else:
+        return None
+
+
 class ObjCPartialMethod:
+    __slots__ = ("methods", "name_start", "superpartial")
+
     _sentinel = object()
 
-    def __init__(self, name_start):
+    def __init__(self, name_start, superpartial=None):
         super().__init__()
 
         self.name_start = name_start
 
-        # A dictionary mapping from a tuple of argument names to the full method name.
-        # Initialized in ObjCClass._load_methods
+        # A dictionary mapping from a tuple of argument names to the full method name,
+        # for the methods defined by the class itself. The methods inherited from
+        # superclasses are found through the superclass' partial method.
+        # Initialized in ObjCClass._cache_partial_method
         self.methods: dict[tuple[str, ...], str] = {}
+        self.superpartial = superpartial
 
     def __repr__(self):
         return f"{type(self).__qualname__}({self.name_start!r})"
 
+    def _find_method_name(self, rest):
+        """Returns the full name of the method with the given argument names, or None
+        if there is no such method."""
+        partial = self
+        while partial is not None:
+            try:
+                return partial.methods[rest]
+            except KeyError:
+                partial = partial.superpartial
+        return None
+
+    def _all_methods(self):
+        """Returns a dictionary of all methods, including the inherited ones."""
+        if self.superpartial is None:
+            return self.methods
+        return {**self.superpartial._all_methods(), **self.methods}
+
     def __call__(self, receiver, first_arg=_sentinel, **kwargs):
         # Ignore parts of argument names after "__".
         order = tuple(argname.split("__")[0] for argname in kwargs)
@@ -328,29 +469,28 @@ class ObjCPartialMethod:
             rest = ("",) + order
 
         # Try to use cached ObjCBoundMethod
-        try:
-            name = self.methods[rest]
+        name = self._find_method_name(rest)
+        if name is not None:
             meth = receiver.objc_class._cache_method(name)
-            return meth(receiver, *args)
-        except KeyError:
-            pass
+            if meth:
+                return meth(receiver, *args)
 
         # Reconstruct the full method name from arguments and look up actual method.
+        # The method tables may be shared with other classes, so they aren't updated
+        # with methods that are found this way.
         if first_arg is self._sentinel:
             name = self.name_start
         else:
-            name = f"{self.name_start}:{':'.join(kwargs.keys())}:"
+            name = f"{self.name_start}{':'.join(rest)}:"
 
         meth = receiver.objc_class._cache_method(name)
 
         if meth:
-            # Update methods cache and call method.
-            self.methods[rest] = name
             return meth(receiver, *args)
 
         raise ValueError(
             f"Invalid selector {name}. Available selectors are: "
-            f"{', '.join(sel for sel in self.methods.values())}"
+            f"{', '.join(sel for sel in self._all_methods().values())}"
         ) from None
 
 
@@ -358,6 +498,9 @@ class ObjCBoundMethod:
     """This represents an Objective-C method (an IMP) which has been bound to some id
     which will be passed as the first parameter to the method."""
 
+    # A bound method is created every time a method is looked up on an instance.
+    __slots__ = ("method", "receiver")
+
     def __init__(self, method, receiver):
         """Initialize with a method and ObjCInstance or ObjCClass object."""
         self.method = method
@@ -884,8 +1027,9 @@ class ObjCInstance:
     # ObjCInstance might be created for it if it is wrapped again later.)
     _cached_objects = weakref.WeakValueDictionary()
 
-    # A re-entrant thread lock moderating access to
-    # ObjCInstance._cached_objects. When creating new instances, there is a time
+    # A re-entrant thread lock moderating additions to
+    # ObjCInstance._cached_objects. (Lookups of existing instances don't need the
+    # lock.) When creating new instances, there is a time
     # gap between determining there has been a cache miss, and the addition of a
     # new instance into the cache. This leaves a gap where a separate thread
     # could wrap the same pointer, and creating a second wrapper; whichever
@@ -938,26 +1082,39 @@ class ObjCInstance:
         if not object_ptr.value:
             return None
 
+        # If an ObjCInstance already exists for the Objective-C object, reuse it
+        # instead of creating a second ObjCInstance for the same object. This is the
+        # common case, so it's checked without taking the lock; the lock is only
+        # needed to avoid creating two wrappers for the same object.
+        try:
+            cached_obj = cls._cached_objects[object_ptr.value]
+        except KeyError:
+            pass
+        else:
+            # We can get a cache hit for methods that return an implicitly retained
+            # object. This is typically the case when:
+            #
+            # 1. A `copy` returns the original object if it is immutable. This is
+            #    typically done for optimization. See
+            #    https://developer.apple.com/documentation/foundation/nscopying.
+            # 2. An `init` call returns an object which we already own from a
+            #    previous `alloc` call. See `init` handling in ObjCMethod. __call__.
+            #
+            # If the object is already in our cache, we end up owning more than one
+            # refcount. We release this additional refcount to prevent memory leaks.
+            if _implicitly_owned:
+                libobjc.objc_release(object_ptr)
+
+            return cached_obj
+
         with ObjCInstance._instance_lock:
             try:
-                # If an ObjCInstance already exists for the Objective-C object,
-                # reuse it instead of creating a second ObjCInstance for the
-                # same object.
+                # Another thread may have wrapped the object in the meantime.
                 cached_obj = cls._cached_objects[object_ptr.value]
 
-                # We can get a cache hit for methods that return an implicitly retained
-                # object. This is typically the case when:
-                #
-                # 1. A `copy` returns the original object if it is immutable. This is
-                #    typically done for optimization. See
-                #    https://developer.apple.com/documentation/foundation/nscopying.
-                # 2. An `init` call returns an object which we already own from a
-                #    previous `alloc` call. See `init` handling in ObjCMethod. __call__.
-                #
-                # If the object is already in our cache, we end up owning more than one
-                # refcount. We release this additional refcount to prevent memory leaks.
+                # Release the additional refcount, as above.
                 if _implicitly_owned:
-                    send_message(object_ptr, "release", restype=objc_id, argtypes=[])
+                    libobjc.objc_release(object_ptr)
 
                 return cached_obj
             except KeyError:
@@ -966,7 +1123,7 @@ class ObjCInstance:
             # Explicitly retain the instance on first handover to Python unless we
             # received it from a method that gives us ownership already.
             if not _implicitly_owned:
-                send_message(object_ptr, "retain", restype=objc_id, argtypes=[])
+                libobjc.objc_retain(object_ptr)
 
             # If the given pointer points to a class, return an ObjCClass instead
             # (if we're not already creating one).
@@ -993,6 +1150,11 @@ class ObjCInstance:
                     self, "block", ObjCBlock(object_ptr)
                 )
 
+            # Register a new class before it can be found in the cache, so that a
+            # method can't be added to it without its caches being invalidated.
+            if isinstance(self, ObjCClass):
+                _register_objc_class(self)
+
             # Store new object in the dictionary of cached objects, keyed
             # by the (integer) memory address pointed to by the object_ptr.
             cls._cached_objects[object_ptr.value] = self
@@ -1002,12 +1164,15 @@ class ObjCInstance:
     def __del__(self):
         # Autorelease our reference on garbage collection of the Python wrapper. We use
         # autorelease instead of release to allow ObjC to take ownership of an object
-        # when it is returned from a factory method.
+        # when it is returned from a factory method. If deferred releases are enabled,
+        # the object is autoreleased later instead, together with other objects.
         try:
-            send_message(self, "autorelease", restype=objc_id, argtypes=[])
-        except (NameError, TypeError):
-            # Handle interpreter shutdown gracefully where send_message might be deleted
-            # (NameError) or set to None (TypeError).
+            if not _defer_release(self.ptr.value):
+                libobjc.objc_autorelease(self.ptr)
+        except (NameError, TypeError, AttributeError):
+            # Handle interpreter shutdown gracefully where libobjc might be deleted
+            # (NameError) or set to None (AttributeError), or where ctypes can no
+            # longer convert the argument (TypeError).
             pass
 
     def __str__(self):
@@ -1081,42 +1246,17 @@ class ObjCInstance:
         # ObjCBoundMethod, so that it will be able to keep the ObjCInstance
         # alive for chained calls like MyClass.alloc().init() where the
         # object created by alloc() is not assigned to a variable.
-
-        # If there's a property with this name; return the value directly.
-        # If the name ends with _, we can shortcut this step, because it's
-        # clear that we're dealing with a method call.
-        if not name.endswith("_"):
-            method = self.objc_class._cache_property_accessor(name)
-            if method:
-                return ObjCBoundMethod(method, self)()
-
-        # See if there's a partial method starting with the given name,
-        # either on self's class or any of the superclasses.
         cls = self.objc_class
-        while cls is not None:
-            # Load the class's methods if we haven't done so yet.
-            with cls.cache_lock:
-                if cls.methods_ptr is None:
-                    cls._load_methods()
-
-                try:
-                    method = cls.partial_methods[name]
-                    break
-                except KeyError:
-                    cls = cls.superclass
-        else:
-            method = None
-
-        if method is None or set(method.methods) == {()}:
-            # Find a method whose full name matches the given name if no partial
-            # method was found, or the partial method can only resolve to a
-            # single method that takes no arguments. The latter case avoids
-            # returning partial methods in cases where a regular method works
-            # just as well.
-            method = self.objc_class._cache_method(name.replace("_", ":"))
+        try:
+            kind, target = cls.resolved_attributes[name]
+        except KeyError:
+            kind, target = cls._resolve_attribute(name)
 
-        if method:
-            return ObjCBoundMethod(method, self)
+        if kind is _ATTR_PROPERTY:
+            # There's a property with this name; return the value directly.
+            return target(self)
+        elif kind is not _ATTR_ASSOCIATED:
+            return ObjCBoundMethod(target, self)
 
         # Check if the attribute name corresponds to an instance attribute defined at
         # runtime from Python. Return it if yes, raise an AttributeError otherwise.
@@ -1151,29 +1291,10 @@ class ObjCInstance:
                     value = value.value
                 ObjCBoundMethod(method, self)(value)
             else:
-                # Wrap the Python object in a WrappedPyObject instance.
-                # A reference will be retained as long as the WrappedPyObject is alive.
-                wrapper = send_message(
-                    send_message(
-                        get_class("WrappedPyObject"),
-                        "alloc",
-                        restype=objc_id,
-                        argtypes=[],
-                    ),
-                    "initWithObjectId:",
-                    id(value),
-                    restype=objc_id,
-                    argtypes=[objc_id],
-                )
-
                 # Set the Python value as an associated object. This will release
                 # any previous wrapper object with the same key.
                 key = self._associated_attr_key_for_name(name)
-                key = self._associated_attr_key_for_name(name)
-                libobjc.objc_setAssociatedObject(self, key, wrapper, 0x301)
-
-                # Release the wrapper object, it will be retained by the association.
-                send_message(wrapper, "release", restype=objc_id, argtypes=[])
+                _set_associated_py_object(self, key, value)
 
     def __delattr__(self, name):
         if name in self.__dict__:
@@ -1435,20 +1556,25 @@ class ObjCClass(ObjCInstance, type):
 
         new_attrs = {
             "name": objc_class_name,
-            "methods_ptr": None,
-            # Mapping of name -> method pointer
-            "instance_method_ptrs": {},
+            # Names of the instance methods defined by the class itself (not
+            # including its superclasses), or None if they haven't been listed yet
+            "method_names": None,
             # Mapping of name -> instance method
             "instance_methods": {},
             # Mapping of name -> (accessor method, mutator method)
             "instance_properties": {},
             # Explicitly declared properties
             "forced_properties": set(),
-            # Mapping of first keyword -> ObjCPartialMethod instances
+            # Mapping of first keyword -> ObjCPartialMethod instance, or None if
+            # there are no methods with that first keyword
             "partial_methods": {},
+            # Mapping of attribute name -> (kind, target), describing what the
+            # attribute refers to on instances of this class
+            "resolved_attributes": {},
             # A re-entrant thread lock moderating access to the ObjCClass
             # method/property cache. This ensures that only one thread populates
-            # the cache of methods/properties on each class. The lock is
+            # the cache of methods/properties on each class. Lookups of entries
+            # that are already cached don't take the lock. The lock is
             # re-entrant because there are some dependencies between caches
             # (e.g., cache_property_accessor calls cache_method).
             "cache_lock": threading.RLock(),
@@ -1478,37 +1604,78 @@ class ObjCClass(ObjCInstance, type):
         """Returns a python representation of the named instance method, either by
         looking it up in the cached list of methods or by searching for and creating a
         new method object."""
+        # Cached entries are never modified once they have been added, so they can be
+        # read without holding the lock. Only populating the cache needs the lock.
+        try:
+            return self.instance_methods[name]
+        except KeyError:
+            pass
+
         with self.cache_lock:
             try:
-                # Try to return an existing cached method for the name
+                # Another thread may have populated the cache in the meantime.
                 return self.instance_methods[name]
             except KeyError:
-                supercls = self
-                objc_method = None
-                while supercls is not None:
-                    # Load the class's methods if we haven't done so yet.
-                    if supercls.methods_ptr is None:
-                        supercls._load_methods()
-
-                    try:
-                        objc_method = supercls.instance_methods[name]
-                        break
-                    except KeyError:
-                        pass
-
-                    try:
-                        objc_method = ObjCMethod(supercls.instance_method_ptrs[name])
-                        break
-                    except KeyError:
-                        pass
-
-                    supercls = supercls.superclass
-
-                if objc_method is None:
+                # The runtime also searches the superclasses, so there's no need to
+                # list the methods of this class or any of its superclasses.
+                method_ptr = libobjc.class_getInstanceMethod(self, SEL(name))
+                if not method_ptr:
                     return None
-                else:
-                    self.instance_methods[name] = objc_method
-                    return objc_method
+
+                objc_method = ObjCMethod(method_ptr)
+                self.instance_methods[name] = objc_method
+                return objc_method
+
+    def _cache_partial_method(self, base_name):
+        """Returns the partial method for all instance methods of this class and its
+        superclasses whose name starts with `base_name`, or None if there are no such
+        methods.
+
+        The partial method is built only when it's first requested. It only stores
+        the methods added by this class, and refers to the superclass' partial method
+        for the others. If this class doesn't add any matching methods, the
+        superclass' partial method is shared.
+        """
+        # Cached entries are never modified once they have been added, so they can be
+        # read without holding the lock. Only populating the cache needs the lock.
+        try:
+            return self.partial_methods[base_name]
+        except KeyError:
+            pass
+
+        with self.cache_lock:
+            try:
+                # Another thread may have populated the cache in the meantime.
+                return self.partial_methods[base_name]
+            except KeyError:
+                pass
+
+            if self.superclass is None:
+                superpartial = None
+            else:
+                superpartial = self.superclass._cache_partial_method(base_name)
+
+            # Only the methods that this class adds are stored; inherited and
+            # overridden methods are found through the superclass' partial method.
+            prefix = base_name + ":"
+            own_methods = {}
+            for name in self._own_method_names():
+                if name == base_name or name.startswith(prefix):
+                    rest = method_name_to_tuple(name)[1]
+                    if (
+                        superpartial is None
+                        or superpartial._find_method_name(rest) is None
+                    ):
+                        own_methods[rest] = name
+
+            if own_methods:
+                partial = ObjCPartialMethod(base_name, superpartial)
+                partial.methods.update(own_methods)
+            else:
+                partial = superpartial
+
+            self.partial_methods[base_name] = partial
+            return partial
 
     def _cache_property_methods(self, name):
         """Return the accessor and mutator for the named property."""
@@ -1550,12 +1717,15 @@ class ObjCClass(ObjCInstance, type):
 
         Existence of a property is done by looking for the write selector (set<Name>:).
         """
-        with self.cache_lock:
-            try:
-                methods = self.instance_properties[name]
-            except KeyError:
-                methods = self._cache_property_methods(name)
-                self.instance_properties[name] = methods
+        try:
+            methods = self.instance_properties[name]
+        except KeyError:
+            with self.cache_lock:
+                try:
+                    methods = self.instance_properties[name]
+                except KeyError:
+                    methods = self._cache_property_methods(name)
+                    self.instance_properties[name] = methods
         if methods:
             return methods[0]
         return None
@@ -1565,16 +1735,85 @@ class ObjCClass(ObjCInstance, type):
 
         Existence of a property is done by looking for the write selector (set<Name>:).
         """
-        with self.cache_lock:
-            try:
-                methods = self.instance_properties[name]
-            except KeyError:
-                methods = self._cache_property_methods(name)
-                self.instance_properties[name] = methods
+        try:
+            methods = self.instance_properties[name]
+        except KeyError:
+            with self.cache_lock:
+                try:
+                    methods = self.instance_properties[name]
+                except KeyError:
+                    methods = self._cache_property_methods(name)
+                    self.instance_properties[name] = methods
         if methods:
             return methods[1]
         return None
 
+    def _resolve_attribute(self, name):
+        """Work out what the attribute `name` refers to on instances of this class.
+
+        The result is a `(kind, target)` tuple, which is stored in
+        `resolved_attributes` so that later accesses to the same attribute only need
+        a single dictionary lookup. See
+        [`ObjCInstance.__getattr__`][rubicon.objc.api.ObjCInstance.__getattr__] for
+        the lookup rules.
+        """
+        with self.cache_lock:
+            try:
+                return self.resolved_attributes[name]
+            except KeyError:
+                pass
+
+            # If there's a property with this name, its getter is used. If the name
+            # ends with _, we can shortcut this step, because it's clear that we're
+            # dealing with a method call.
+            if not name.endswith("_"):
+                method = self._cache_property_accessor(name)
+                if method:
+                    resolution = (_ATTR_PROPERTY, method)
+                    self.resolved_attributes[name] = resolution
+                    return resolution
+
+            # A name containing an underscore is usually a full method name, which
+            # is looked up directly. This avoids listing the methods of this class
+            # and all of its superclasses, which is only needed for partial methods.
+            kind = _ATTR_METHOD
+            method = self._cache_method(name.replace("_", ":")) if "_" in name else None
+
+            if not method:
+                # See if there's a partial method starting with the given name,
+                # either on this class or any of the superclasses.
+                method = self._cache_partial_method(name)
+
+                if method is None or set(method._all_methods()) == {()}:
+                    # Find a method whose full name matches the given name if no
+                    # partial method was found, or the partial method can only
+                    # resolve to a single method that takes no arguments. The latter
+                    # case avoids returning partial methods in cases where a regular
+                    # method works just as well.
+                    method = self._cache_method(name.replace("_", ":"))
+                else:
+                    kind = _ATTR_PARTIAL_METHOD
+
+            if method:
+                resolution = (kind, method)
+            else:
+                # Not an Objective-C attribute; it may still be an attribute that was
+                # set on an individual instance from Python.
+                resolution = (_ATTR_ASSOCIATED, None)
+
+            self.resolved_attributes[name] = resolution
+            return resolution
+
+    def _invalidate_method_caches(self):
+        """Discard everything that has been cached about the methods of this class, so
+        that it is loaded again from the Objective-C runtime when next needed."""
+        with self.cache_lock:
+            self.method_names = None
+            self.instance_methods = {}
+            self.instance_properties = {}
+            self.partial_methods = {}
+            self.resolved_attributes = {}
+
     def declare_property(self, name):
         """Declare the instance method `name` to be a property getter.
 
@@ -1613,12 +1852,19 @@ class ObjCClass(ObjCInstance, type):
         """
         self.forced_properties.add(name)
 
+        # The name may already have been resolved as a method on this class or one of
+        # its subclasses.
+        for objc_class in list(_objc_class_descendants.get(self.ptr.value, ())):
+            with objc_class.cache_lock:
+                objc_class.instance_properties.pop(name, None)
+                objc_class.resolved_attributes.pop(name, None)
+
     def declare_class_property(self, name):
         """Declare the class method `name` to be a property getter.
 
         This is equivalent to `self.objc_class.declare_property(name)`.
         """
-        self.objc_class.forced_properties.add(name)
+        self.objc_class.declare_property(name)
 
     def __repr__(self):
         return f"<{type(self).__qualname__}: {self.name}>"
@@ -1627,7 +1873,9 @@ class ObjCClass(ObjCInstance, type):
         return f"{type(self).__name__}({self.name!r})"
 
     def __del__(self):
-        libc.free(self.methods_ptr)
+        # Objective-C classes are never deallocated, so unlike ObjCInstance, there is
+        # no reference to release.
+        pass
 
     def __instancecheck__(self, instance):
         """Check whether the given object is an instance of this class.
@@ -1660,47 +1908,56 @@ class ObjCClass(ObjCInstance, type):
                 f"not {type(subclass).__module__}.{type(subclass).__qualname__}"
             )
 
-    def _load_methods(self):
-        if self.methods_ptr is not None:
-            raise RuntimeError(f"{self}._load_methods cannot be called more than once")
-
-        # Traverse superclasses and load methods.
-        superclass = self.superclass
+    def _own_method_names(self):
+        """Returns the names of the instance methods defined by this class itself.
 
-        while superclass is not None:
-            if superclass.methods_ptr is None:
-                with superclass.cache_lock:
-                    superclass._load_methods()
+        The names are listed when they're first needed. They are only used to build
+        partial methods; methods with a known full name are looked up directly.
+        """
+        with self.cache_lock:
+            if self.method_names is None:
+                methods_ptr_count = c_uint(0)
+                methods_ptr = libobjc.class_copyMethodList(
+                    self, byref(methods_ptr_count)
+                )
+                try:
+                    names = tuple(
+                        libobjc.method_getName(methods_ptr[i]).name.decode("utf-8")
+                        for i in range(methods_ptr_count.value)
+                    )
+                finally:
+                    libc.free(methods_ptr)
 
-            # Prime this class' partials list with a list from the superclass.
-            for first, superpartial in superclass.partial_methods.items():
-                partial = ObjCPartialMethod(first)
-                self.partial_methods[first] = partial
-                partial.methods.update(superpartial.methods)
+                self.method_names = names
 
-            superclass = superclass.superclass
+            return self.method_names
 
-        # Load methods for this class.
-        methods_ptr_count = c_uint(0)
-        methods_ptr = libobjc.class_copyMethodList(self, byref(methods_ptr_count))
 
-        for i in range(methods_ptr_count.value):
-            method = methods_ptr[i]
-            name = libobjc.method_getName(method).name.decode("utf-8")
-            self.instance_method_ptrs[name] = method
+def _register_objc_class(objc_class):
+    """Record a new ObjCClass under its own address and those of all its
+    superclasses."""
+    ptr = objc_class.ptr
+    while ptr.value is not None:
+        try:
+            descendants = _objc_class_descendants[ptr.value]
+        except KeyError:
+            descendants = _objc_class_descendants[ptr.value] = weakref.WeakSet()
+        descendants.add(objc_class)
+        ptr = libobjc.class_getSuperclass(ptr)
 
-            base_name, argument_names = method_name_to_tuple(name)
 
-            try:
-                partial = self.partial_methods[base_name]
-            except KeyError:
-                partial = ObjCPartialMethod(base_name)
-                self.partial_methods[base_name] = partial
+def _method_added(cls):
+    """Invalidate the method caches of a class and its subclasses after a method was
+    added to (or replaced in) the class at runtime."""
+    class_ptr = getattr(cls, "_as_parameter_", cls).value
+    # Nothing is found for a class that hasn't been wrapped in an ObjCClass and has
+    # no wrapped subclasses. This is always the case for the methods added while
+    # creating a new class.
+    for objc_class in list(_objc_class_descendants.get(class_ptr, ())):
+        objc_class._invalidate_method_caches()
 
-            partial.methods[argument_names] = name
 
-        # Set the list of methods for the class to the computed list.
-        self.methods_ptr = methods_ptr
+_add_method_hooks.append(_method_added)
 
 
 class ObjCMetaClass(ObjCClass):
@@ -1767,13 +2024,94 @@ NSMutableDictionary = ObjCClass("NSMutableDictionary")
 Protocol = ObjCClass("Protocol")
 
 
-def py_from_ns(nsobj):
+# Converters explicitly registered for Objective-C classes, keyed by class address.
+_converter_for_objcclass_map = {}
+# Converters found for concrete classes by walking their superclass chain, keyed by
+# class address. Cleared whenever the registrations change.
+_converter_for_objcclass_cache = {}
+
+
+def converter_for_objcclass(objcclass):
+    """Look up the function used by [`py_from_ns`][rubicon.objc.api.py_from_ns] to
+    convert instances of the given Objective-C class.
+
+    If the exact Objective-C class is not registered, each superclass is checked in
+    turn, and the converter of the closest registered superclass is used. If no class
+    in the superclass chain is registered, `None` is returned. The result is cached
+    for each class, so that converting many objects of the same class only needs a
+    single dictionary lookup per object.
+    """
+    if isinstance(objcclass, ObjCClass):
+        objcclass = objcclass.ptr
+
+    try:
+        return _converter_for_objcclass_cache[objcclass.value]
+    except KeyError:
+        pass
+
+    superclass = objcclass
+    converter = None
+    while superclass.value is not None:
+        try:
+            converter = _converter_for_objcclass_map[superclass.value]
+        except KeyError:
+            superclass = libobjc.class_getSuperclass(superclass)
+        else:
+            break
+
+    _converter_for_objcclass_cache[objcclass.value] = converter
+    return converter
+
+
+def register_converter_for_objcclass(converter, objcclass):
+    """Register a function that [`py_from_ns`][rubicon.objc.api.py_from_ns] uses to
+    convert instances of an Objective-C class (or a subclass) into Python objects.
+
+    The converter is called with the object to convert as an
+    [`objc_id`][rubicon.objc.runtime.objc_id], and returns the converted Python
+    object. Use [`ObjCInstance`][rubicon.objc.api.ObjCInstance] to wrap the object
+    if high-level access to it is needed, and
+    [`py_from_ns`][rubicon.objc.api.py_from_ns] to convert any objects that it
+    contains. If a converter is already registered for `objcclass`, it is replaced.
+    See [`converter_for_objcclass`][rubicon.objc.api.converter_for_objcclass] for a
+    full description of the lookup process.
+    """
+    if isinstance(objcclass, ObjCClass):
+        objcclass = objcclass.ptr
+
+    _converter_for_objcclass_map[objcclass.value] = converter
+    _converter_for_objcclass_cache.clear()
+
+
+def unregister_converter_for_objcclass(objcclass):
+    """Unregister the [`py_from_ns`][rubicon.objc.api.py_from_ns] converter for an
+    Objective-C class.
+
+    Instances of the class are then converted using the converter of the closest
+    registered superclass, if any.
+    """
+    if isinstance(objcclass, ObjCClass):
+        objcclass = objcclass.ptr
+
+    del _converter_for_objcclass_map[objcclass.value]
+    _converter_for_objcclass_cache.clear()
+
+
+def get_converter_for_objcclass_map():
+    """Get a copy of all currently registered
+    [`py_from_ns`][rubicon.objc.api.py_from_ns] converters as a mapping.
+
+    Keys are Objective-C class addresses as [`int`][]s.
+    """
+    return dict(_converter_for_objcclass_map)
+
+
+def py_from_ns(nsobj, *, no_copy=False):
     """Convert a Foundation object into an equivalent Python object if possible.
 
     Currently supported types:
 
-    * [`objc_id`][rubicon.objc.runtime.objc_id]: Wrapped in an
-         [`ObjCInstance`][rubicon.objc.api.ObjCInstance] and converted as below
+    * [`objc_id`][rubicon.objc.runtime.objc_id]: Converted as below
     * [`NSString`][rubicon.objc.api.NSString]: Converted to [`str`][]
     * [`NSData`][rubicon.objc.api.NSData]: Converted to [`bytes`][]
     * [`NSDecimalNumber`][rubicon.objc.api.NSDecimalNumber]: Converted to
@@ -1785,52 +2123,283 @@ def py_from_ns(nsobj):
     * [`NSNumber`][rubicon.objc.api.NSNumber]: Converted to a [`bool`][], [`int`][] or
          [`float`][] based on the type of its contents
 
+    Conversions for other classes can be added using
+    [`register_converter_for_objcclass`][rubicon.objc.api.register_converter_for_objcclass].
+
     Other objects are returned unmodified as an
     [`ObjCInstance`][rubicon.objc.api.ObjCInstance].
+
+    If `no_copy` is true and `nsobj` is an [`NSData`][rubicon.objc.api.NSData], it is
+    converted to a read-only [`memoryview`][] of its contents instead of
+    [`bytes`][]. The contents are not copied, and the `NSData` is kept alive for as
+    long as the [`memoryview`][] (or any buffer derived from it) is in use. A mutable
+    `NSMutableData` is copied once, so that the view can't change (or be invalidated)
+    when the original data is modified. `no_copy` only applies to `nsobj` itself; the
+    contents of an [`NSArray`][rubicon.objc.api.NSArray] or
+    [`NSDictionary`][rubicon.objc.api.NSDictionary] are always copied.
     """
-    if isinstance(nsobj, (objc_id, Class)):
-        nsobj = ObjCInstance(nsobj)
-    if not isinstance(nsobj, ObjCInstance):
+    if isinstance(nsobj, ObjCInstance):
+        ptr = nsobj.ptr
+    elif isinstance(nsobj, (objc_id, Class)):
+        ptr = nsobj
+    else:
         return nsobj
 
-    if nsobj.isKindOfClass(NSDecimalNumber):
-        return decimal.Decimal(str(nsobj.descriptionWithLocale(None)))
-    elif nsobj.isKindOfClass(NSNumber):
-        # Choose the property to access based on the type encoding. The actual
-        # conversion is done by ctypes. Signed and unsigned integers are in
-        # separate cases to prevent overflow with unsigned long longs.
-        objc_type = nsobj.objCType
-        if objc_type == b"B":
-            return nsobj.boolValue
-        elif objc_type in b"csilq":
-            return nsobj.longLongValue
-        elif objc_type in b"CSILQ":
-            return nsobj.unsignedLongLongValue
-        elif objc_type in b"fd":
-            return nsobj.doubleValue
-        else:
-            raise TypeError(
-                f"NSNumber containing unsupported type {objc_type!r} "
-                "cannot be converted to a Python object"
+    if no_copy and ptr.value and _is_nsdata(ptr):
+        return _memoryview_from_nsdata(ptr)
+    else:
+        return _py_from_ns_ptr(ptr)
+
+
+def _py_from_ns_ptr(ptr):
+    """Convert a Foundation object, given as a raw
+    [`objc_id`][rubicon.objc.runtime.objc_id], into an equivalent Python object.
+
+    The conversion rules are the same as for
+    [`py_from_ns`][rubicon.objc.api.py_from_ns]. The converter is looked up by the
+    object's class, so classifying an object takes a single dictionary lookup once its
+    class has been seen. The built-in converters work on raw pointers as well, and
+    copy the contents of collections out with a single message, so that no
+    [`ObjCInstance`][rubicon.objc.api.ObjCInstance] wrapper needs to be created for
+    any of them. Only objects that aren't converted are wrapped.
+    """
+    if not ptr.value:
+        return None
+
+    objcclass = libobjc.object_getClass(ptr)
+    try:
+        converter = _converter_for_objcclass_cache[objcclass.value]
+    except KeyError:
+        converter = converter_for_objcclass(objcclass)
+
+    if converter is None:
+        return ObjCInstance(ptr)
+    else:
+        return converter(ptr)
+
+
+def _py_from_nsdecimalnumber(ptr):
+    description = send_message(
+        ptr,
+        "descriptionWithLocale:",
+        None,
+        restype=objc_id,
+        argtypes=[objc_id],
+    )
+    return decimal.Decimal(_str_from_nsstring_ptr(description))
+
+
+# The NSNumber accessors, as `(objc_msgSend variant, selector)` pairs, keyed by the
+# type encoding returned by `objCType`. The accessors are chosen based on the type
+# encoding, and the actual conversion is done by ctypes. Signed and unsigned integers
+# use separate accessors to prevent overflow with unsigned long longs.
+_nsnumber_objctype = (_msg_send_for_types(c_char_p, []), SEL("objCType"))
+_nsnumber_accessors = {
+    bytes([encoding]): (_msg_send_for_types(restype, []), SEL(selector))
+    for restype, selector, encodings in [
+        (c_bool, "boolValue", b"B"),
+        (c_longlong, "longLongValue", b"csilq"),
+        (c_ulonglong, "unsignedLongLongValue", b"CSILQ"),
+        (c_double, "doubleValue", b"fd"),
+    ]
+    for encoding in encodings
+}
+
+# The shared NSNumber instances for YES and NO (kCFBooleanTrue and kCFBooleanFalse).
+# Their type encoding is the same as for char, so they can only be told apart from
+# other numbers by their address.
+_nsnumber_true = send_message(
+    NSNumber, "numberWithBool:", True, restype=objc_id, argtypes=[c_bool]
+).value
+_nsnumber_false = send_message(
+    NSNumber, "numberWithBool:", False, restype=objc_id, argtypes=[c_bool]
+).value
+
+
+def _py_from_nsnumber(ptr):
+    if ptr.value == _nsnumber_true:
+        return True
+    elif ptr.value == _nsnumber_false:
+        return False
+
+    send, selector = _nsnumber_objctype
+    objc_type = send(ptr, selector)
+    try:
+        send, selector = _nsnumber_accessors[objc_type]
+    except KeyError:
+        raise TypeError(
+            f"NSNumber containing unsupported type {objc_type!r} "
+            "cannot be converted to a Python object"
+        ) from None
+    return send(ptr, selector)
+
+
+# The CoreFoundation functions used to access the contents of an NSString directly.
+# NSString and CFString are toll-free bridged, so these work on any NSString.
+_libcf = load_library("CoreFoundation")
+
+# CFIndex CFStringGetLength(CFStringRef theString);
+_libcf.CFStringGetLength.restype = CFIndex
+_libcf.CFStringGetLength.argtypes = [objc_id]
+# const char *CFStringGetCStringPtr(CFStringRef theString, CFStringEncoding encoding);
+_libcf.CFStringGetCStringPtr.restype = c_void_p
+_libcf.CFStringGetCStringPtr.argtypes = [objc_id, c_uint32]
+# const UniChar *CFStringGetCharactersPtr(CFStringRef theString);
+_libcf.CFStringGetCharactersPtr.restype = c_void_p
+_libcf.CFStringGetCharactersPtr.argtypes = [objc_id]
+
+_kCFStringEncodingUTF8 = 0x08000100
+
+# The number of UTF-16 code units copied out of an NSString at a time, if its
+# contents can't be accessed directly. This bounds the size of the temporary buffer
+# needed to convert very large strings.
+_NSSTRING_CHUNK_LENGTH = 64 * 1024
+
+
+def _str_from_nsstring_ptr(ptr):
+    """Convert an NSString, given as a raw [`objc_id`][rubicon.objc.runtime.objc_id],
+    into a [`str`][].
+
+    If possible, the string's internal buffer is decoded directly. Otherwise, its
+    UTF-16 contents are copied out in chunks and decoded incrementally. Unpaired
+    surrogates (which an NSString may contain) are preserved.
+    """
+    length = _libcf.CFStringGetLength(ptr)
+    if length == 0:
+        return ""
+
+    # Strings that are stored as 8-bit characters can expose their buffer as a C
+    # string. Only use it if each byte is a single character, i.e. the string is
+    # pure ASCII. This also rejects strings containing NUL characters.
+    address = _libcf.CFStringGetCStringPtr(ptr, _kCFStringEncodingUTF8)
+    if address is not None:
+        data = string_at(address)
+        if len(data) == length:
+            return data.decode("ascii")
+
+    # Strings that are stored as UTF-16 can expose their buffer directly.
+    address = _libcf.CFStringGetCharactersPtr(ptr)
+    if address is not None:
+        return str(
+            (c_uint8 * (length * sizeof(unichar))).from_address(address),
+            "utf-16-le",
+            "surrogatepass",
+        )
+
+    # Otherwise, copy the contents out. Very large strings are copied in chunks,
+    # and the incremental decoder takes care of surrogate pairs that are split
+    # between chunks.
+    chunk_length = min(length, _NSSTRING_CHUNK_LENGTH)
+    buffer = (unichar * chunk_length)()
+    if chunk_length == length:
+        _send_get_characters(ptr, buffer, 0, length)
+        return str(buffer, "utf-16-le", "surrogatepass")
+
+    decoder = codecs.getincrementaldecoder("utf-16-le")("surrogatepass")
+    data = memoryview(buffer).cast("B")
+    parts = []
+    for location in range(0, length, chunk_length):
+        count = min(chunk_length, length - location)
+        _send_get_characters(ptr, buffer, location, count)
+        parts.append(
+            decoder.decode(
+                data[: count * sizeof(unichar)],
+                final=location + count == length,
             )
-    elif nsobj.isKindOfClass(NSString):
-        return str(nsobj)
-    elif nsobj.isKindOfClass(NSData):
-        # Despite the name, string_at converts the data at the address to a
-        # bytes object, not str.
-        return string_at(
-            send_message(nsobj, "bytes", restype=POINTER(c_uint8), argtypes=[]),
-            nsobj.length,
         )
-    elif nsobj.isKindOfClass(NSDictionary):
-        return {py_from_ns(k): py_from_ns(v) for k, v in nsobj.items()}
-    elif nsobj.isKindOfClass(NSArray):
-        return [py_from_ns(o) for o in nsobj]
-    else:
-        return nsobj
+    return "".join(parts)
+
+
+def _send_get_characters(ptr, buffer, location, length):
+    send_message(
+        ptr,
+        "getCharacters:range:",
+        buffer,
+        NSRange(location, length),
+        restype=None,
+        argtypes=[POINTER(unichar), NSRange],
+    )
+
+
+def _py_from_nsdata(ptr):
+    # Despite the name, string_at converts the data at the address to a
+    # bytes object, not str.
+    return string_at(
+        send_message(ptr, "bytes", restype=POINTER(c_uint8), argtypes=[]),
+        send_message(ptr, "length", restype=NSUInteger, argtypes=[]),
+    )
+
+
+def _is_nsdata(ptr):
+    return send_message(
+        ptr, "isKindOfClass:", NSData, restype=c_bool, argtypes=[objc_id]
+    )
+
+
+def _memoryview_from_nsdata(ptr):
+    """Expose the contents of an NSData, given as a raw
+    [`objc_id`][rubicon.objc.runtime.objc_id], as a read-only [`memoryview`][]
+    without copying them."""
+    # For an immutable NSData, copy only retains the receiver. A mutable NSData is
+    # copied, so that its contents can't move while the memoryview is in use.
+    nsdata = ObjCInstance(
+        send_message(ptr, "copy", restype=objc_id, argtypes=[]),
+        _implicitly_owned=True,
+    )
+    length = send_message(nsdata, "length", restype=NSUInteger, argtypes=[])
+    if length == 0:
+        return memoryview(b"")
+
+    address = send_message(nsdata, "bytes", restype=c_void_p, argtypes=[])
+    buffer = (c_uint8 * length).from_address(address)
+    # The memoryview keeps the ctypes array alive, and the array keeps the NSData
+    # alive.
+    buffer._nsdata = nsdata
+    return memoryview(buffer).cast("B").toreadonly()
+
+
+def _py_from_nsdictionary(ptr):
+    count = send_message(ptr, "count", restype=NSUInteger, argtypes=[])
+    keys = (objc_id * count)()
+    values = (objc_id * count)()
+    send_message(
+        ptr,
+        "getObjects:andKeys:count:",
+        values,
+        keys,
+        count,
+        restype=None,
+        argtypes=[POINTER(objc_id), POINTER(objc_id), NSUInteger],
+    )
+    return {
+        _py_from_ns_ptr(k): _py_from_ns_ptr(v)
+        for k, v in zip(keys, values, strict=True)
+    }
+
+
+def _py_from_nsarray(ptr):
+    count = send_message(ptr, "count", restype=NSUInteger, argtypes=[])
+    objects = (objc_id * count)()
+    send_message(
+        ptr,
+        "getObjects:range:",
+        objects,
+        NSRange(0, count),
+        restype=None,
+        argtypes=[POINTER(objc_id), NSRange],
+    )
+    return [_py_from_ns_ptr(o) for o in objects]
+
+
+register_converter_for_objcclass(_py_from_nsdecimalnumber, NSDecimalNumber)
+register_converter_for_objcclass(_py_from_nsnumber, NSNumber)
+register_converter_for_objcclass(_str_from_nsstring_ptr, NSString)
+register_converter_for_objcclass(_py_from_nsdata, NSData)
+register_converter_for_objcclass(_py_from_nsdictionary, NSDictionary)
+register_converter_for_objcclass(_py_from_nsarray, NSArray)
 
 
-def ns_from_py(pyobj):
+def ns_from_py(pyobj, *, no_copy=False):
     """Convert a Python object into an equivalent Foundation object.
 
     The returned object is autoreleased.
@@ -1845,7 +2414,9 @@ def ns_from_py(pyobj):
     * [`enum.Enum`][]: Replaced by their [`value`][enum.Enum.value] and
          converted as below
     * [`str`][]: Converted to [`NSString`][rubicon.objc.api.NSString]
-    * [`bytes`][]: Converted to [`NSData`][rubicon.objc.api.NSData]
+    * [`bytes`][] and other objects supporting the buffer protocol (such as
+         [`bytearray`][], [`memoryview`][] or [`mmap.mmap`][]): Converted to
+         [`NSData`][rubicon.objc.api.NSData]
     * [`decimal.Decimal`][]: Converted to
          [`NSDecimalNumber`][rubicon.objc.api.NSDecimalNumber]
     * [`dict`][]: Converted to [`NSDictionary`][rubicon.objc.api.NSDictionary], with
@@ -1855,50 +2426,435 @@ def ns_from_py(pyobj):
     * [`bool`][], [`int`][], [`float`][]: Converted to
          [`NSNumber`][rubicon.objc.api.NSNumber]
 
-    Other types cause a [`TypeError`][].
+    Other types cause a [`TypeError`][]. Foundation collections cannot contain `nil`,
+    so a [`dict`][] or [`list`][] containing `None` causes a [`ValueError`][].
+
+    If `no_copy` is true and `pyobj` supports the buffer protocol, the returned
+    `NSData` uses the buffer's memory directly instead of a copy of it. The buffer
+    is kept alive (and, for resizable objects like [`bytearray`][], locked against
+    resizing) for as long as the `NSData` exists. The buffer must be C-contiguous, and
+    its contents must not be modified while the `NSData` is in use. Similarly, a
+    long ASCII [`str`][] is converted to an `NSString` that uses the contents of the
+    [`str`][] object directly, and is kept alive for as long as the `NSString`
+    exists; other strings are always copied. `no_copy` only applies to `pyobj`
+    itself; the contents of a [`dict`][] or [`list`][] are always copied.
     """
     if isinstance(pyobj, enum.Enum):
         pyobj = pyobj.value
 
-    # Many Objective-C method calls here use the convert_result=False kwarg to
-    # disable automatic conversion of return values, because otherwise most of
-    # the Objective-C objects would be converted back to Python objects.
     if pyobj is None or isinstance(pyobj, ObjCInstance):
         return pyobj
+    else:
+        return ObjCInstance(_ns_ptr_from_py(pyobj, no_copy=no_copy))
+
+
+def _ns_ptr_from_py(pyobj, no_copy=False):
+    """Convert a Python object into an equivalent Foundation object, returned as a raw
+    [`objc_id`][rubicon.objc.runtime.objc_id].
+
+    The conversion rules are the same as for
+    [`ns_from_py`][rubicon.objc.api.ns_from_py], except that `None` is rejected with a
+    [`ValueError`][], because it cannot be stored in a Foundation collection. The
+    returned object is autoreleased, and is not wrapped in an
+    [`ObjCInstance`][rubicon.objc.api.ObjCInstance]. This avoids creating (and
+    retaining) a wrapper for every element when converting large collections.
+    """
+    if isinstance(pyobj, enum.Enum):
+        pyobj = pyobj.value
+
+    if isinstance(pyobj, ObjCInstance):
+        return pyobj.ptr
+    elif pyobj is None:
+        raise ValueError("None cannot be stored in a Foundation collection")
     elif isinstance(pyobj, str):
-        return ObjCInstance(
-            NSString.stringWithUTF8String_(pyobj.encode("utf-8"), convert_result=False)
+        return _nsstring_ptr_from_str(pyobj, no_copy)
+    elif isinstance(pyobj, bytes) and not no_copy:
+        return send_message(
+            NSData,
+            "dataWithBytes:length:",
+            pyobj,
+            len(pyobj),
+            restype=objc_id,
+            argtypes=[c_char_p, NSUInteger],
         )
-    elif isinstance(pyobj, bytes):
-        return ObjCInstance(NSData.dataWithBytes(pyobj, length=len(pyobj)))
     elif isinstance(pyobj, decimal.Decimal):
-        return ObjCInstance(
-            NSDecimalNumber.decimalNumberWithString_(
-                pyobj.to_eng_string(), convert_result=False
-            )
+        return send_message(
+            NSDecimalNumber,
+            "decimalNumberWithString:",
+            _ns_ptr_from_py(pyobj.to_eng_string()),
+            restype=objc_id,
+            argtypes=[objc_id],
         )
     elif isinstance(pyobj, dict):
-        dikt = NSMutableDictionary.dictionaryWithCapacity(len(pyobj))
-        for k, v in pyobj.items():
-            dikt.setObject(v, forKey=k)
-        return dikt
+        # Convert all keys and values first, then create the dictionary with a
+        # single message.
+        count = len(pyobj)
+        keys = (objc_id * count)(*[_ns_ptr_from_py(k) for k in pyobj])
+        values = (objc_id * count)(*[_ns_ptr_from_py(v) for v in pyobj.values()])
+        return send_message(
+            NSMutableDictionary,
+            "dictionaryWithObjects:forKeys:count:",
+            values,
+            keys,
+            count,
+            restype=objc_id,
+            argtypes=[POINTER(objc_id), POINTER(objc_id), NSUInteger],
+        )
     elif isinstance(pyobj, list):
-        array = NSMutableArray.arrayWithCapacity(len(pyobj))
-        for v in pyobj:
-            array.addObject(v)
-        return array
+        # Convert all elements first, then create the array with a single message.
+        count = len(pyobj)
+        objects = (objc_id * count)(*[_ns_ptr_from_py(v) for v in pyobj])
+        return send_message(
+            NSMutableArray,
+            "arrayWithObjects:count:",
+            objects,
+            count,
+            restype=objc_id,
+            argtypes=[POINTER(objc_id), NSUInteger],
+        )
     elif isinstance(pyobj, bool):
-        return ObjCInstance(NSNumber.numberWithBool_(pyobj, convert_result=False))
+        return send_message(
+            NSNumber, "numberWithBool:", pyobj, restype=objc_id, argtypes=[c_bool]
+        )
     elif isinstance(pyobj, int):
-        return ObjCInstance(NSNumber.numberWithLong_(pyobj, convert_result=False))
+        return send_message(
+            NSNumber, "numberWithLong:", pyobj, restype=objc_id, argtypes=[c_long]
+        )
     elif isinstance(pyobj, float):
-        return ObjCInstance(NSNumber.numberWithDouble_(pyobj, convert_result=False))
+        return send_message(
+            NSNumber, "numberWithDouble:", pyobj, restype=objc_id, argtypes=[c_double]
+        )
     else:
+        try:
+            # ctypes objects support the buffer protocol, but they are C values
+            # (such as pointers), not binary data.
+            if isinstance(pyobj, _ctypes_data_types):
+                raise TypeError
+            view = memoryview(pyobj)
+        except TypeError:
+            raise TypeError(
+                f"Don't know how to convert a "
+                f"{type(pyobj).__module__}.{type(pyobj).__qualname__} to a Foundation "
+                f"object"
+            ) from None
+        return _nsdata_ptr_from_buffer(view, no_copy)
+
+
+# The base classes of ctypes instances, which are never converted to NSData.
+_ctypes_data_types = (_SimpleCData, Structure, Union, Array, _Pointer)
+
+
+class _Py_buffer(Structure):
+    _fields_ = [
+        ("buf", c_void_p),
+        ("obj", c_void_p),
+        ("len", c_ssize_t),
+        ("itemsize", c_ssize_t),
+        ("readonly", c_int),
+        ("ndim", c_int),
+        ("format", c_char_p),
+        ("shape", c_void_p),
+        ("strides", c_void_p),
+        ("suboffsets", c_void_p),
+        ("internal", c_void_p),
+    ]
+
+
+# Look up private copies of the functions (using subscript syntax), so that setting
+# their argtypes doesn't affect other users of pythonapi.
+# int PyObject_GetBuffer(PyObject *exporter, Py_buffer *view, int flags);
+_PyObject_GetBuffer = pythonapi["PyObject_GetBuffer"]
+_PyObject_GetBuffer.restype = c_int
+_PyObject_GetBuffer.argtypes = [py_object, POINTER(_Py_buffer), c_int]
+# void PyBuffer_Release(Py_buffer *view);
+_PyBuffer_Release = pythonapi["PyBuffer_Release"]
+_PyBuffer_Release.restype = None
+_PyBuffer_Release.argtypes = [POINTER(_Py_buffer)]
+
+_PyBUF_SIMPLE = 0
+
+# const char *PyUnicode_AsUTF8AndSize(PyObject *unicode, Py_ssize_t *size);
+_PyUnicode_AsUTF8AndSize = pythonapi["PyUnicode_AsUTF8AndSize"]
+_PyUnicode_AsUTF8AndSize.restype = c_void_p
+_PyUnicode_AsUTF8AndSize.argtypes = [py_object, POINTER(c_ssize_t)]
+
+# The key under which a buffer is associated with an NSData or NSString that uses its
+# memory.
+_no_copy_buffer_key = SEL("rubicon.objc.no_copy_buffer")
+
+_NSUTF8StringEncoding = 4
+_NSISOLatin1StringEncoding = 5
+
+# Shorter strings are always copied when converting them to NSString. Copying them is
+# cheap, and Foundation may return a shared or tagged pointer string for them, which
+# can't keep a Python object alive.
+_NSSTRING_NO_COPY_MIN_LENGTH = 1024
+
+
+def _nsstring_ptr_from_str(pystr, no_copy):
+    """Convert a str into an autoreleased NSString, returned as a raw
+    [`objc_id`][rubicon.objc.runtime.objc_id]."""
+    string = send_message(NSString, "alloc", restype=objc_id, argtypes=[])
+
+    if no_copy and len(pystr) >= _NSSTRING_NO_COPY_MIN_LENGTH and pystr.isascii():
+        # Python stores ASCII strings as UTF-8, so the str's contents can be used
+        # directly. Any other str would have a UTF-8 copy created and kept for its
+        # lifetime, so those are copied normally instead.
+        size = c_ssize_t()
+        address = _PyUnicode_AsUTF8AndSize(pystr, byref(size))
+        string = send_message(
+            string,
+            "initWithBytesNoCopy:length:encoding:freeWhenDone:",
+            address,
+            size.value,
+            _NSUTF8StringEncoding,
+            False,
+            restype=objc_id,
+            argtypes=[c_void_p, NSUInteger, NSUInteger, c_bool],
+        )
+        _set_associated_py_object(string, _no_copy_buffer_key, pystr)
+        return send_message(string, "autorelease", restype=objc_id, argtypes=[])
+
+    # Latin-1 strings (including ASCII) are stored by Python as one byte per
+    # character, so encoding them is a plain copy, and NSString can store them
+    # compactly as well. Other strings are passed as UTF-16, which is NSString's
+    # native representation. Unlike UTF-8 C strings, both can contain NUL characters.
+    try:
+        data = pystr.encode("latin-1")
+    except UnicodeEncodeError:
+        data = pystr.encode("utf-16-le", "surrogatepass")
+        string = send_message(
+            string,
+            "initWithCharacters:length:",
+            data,
+            len(data) // sizeof(unichar),
+            restype=objc_id,
+            argtypes=[c_char_p, NSUInteger],
+        )
+    else:
+        string = send_message(
+            string,
+            "initWithBytes:length:encoding:",
+            data,
+            len(data),
+            _NSISOLatin1StringEncoding,
+            restype=objc_id,
+            argtypes=[c_char_p, NSUInteger, NSUInteger],
+        )
+    return send_message(string, "autorelease", restype=objc_id, argtypes=[])
+
+
+def _buffer_address(view):
+    """Get the address of the memory of a contiguous memoryview."""
+    buffer = _Py_buffer()
+    _PyObject_GetBuffer(view, byref(buffer), _PyBUF_SIMPLE)
+    try:
+        return buffer.buf
+    finally:
+        _PyBuffer_Release(byref(buffer))
+
+
+def _nsdata_ptr_from_buffer(view, no_copy):
+    """Convert a memoryview into an autoreleased NSData, returned as a raw
+    [`objc_id`][rubicon.objc.runtime.objc_id]."""
+    if not view.c_contiguous:
+        if no_copy:
+            raise ValueError(
+                "Only C-contiguous buffers can be converted to NSData without copying"
+            )
+        view = memoryview(view.tobytes())
+
+    length = view.nbytes
+    if not no_copy or length == 0:
+        return send_message(
+            NSData,
+            "dataWithBytes:length:",
+            _buffer_address(view) if length else None,
+            length,
+            restype=objc_id,
+            argtypes=[c_void_p, NSUInteger],
+        )
+
+    data = send_message(
+        NSData,
+        "dataWithBytesNoCopy:length:freeWhenDone:",
+        _buffer_address(view),
+        length,
+        False,
+        restype=objc_id,
+        argtypes=[c_void_p, NSUInteger, c_bool],
+    )
+    # The memoryview holds the buffer exported, which keeps the memory in place.
+    _set_associated_py_object(data, _no_copy_buffer_key, view)
+    return data
+
+
+# The array.array typecodes that can be converted to and from NSNumbers, mapped to
+# the NSNumber accessor used to read each element (see _nsnumber_accessors), and the
+# NSNumber factory method used to create an element, as `(objc_msgSend variant,
+# selector)` pairs.
+_array_nsnumber_accessors = {
+    **dict.fromkeys("fd", _nsnumber_accessors[b"d"]),
+    **dict.fromkeys("bhilq", _nsnumber_accessors[b"q"]),
+    **dict.fromkeys("BHILQ", _nsnumber_accessors[b"Q"]),
+}
+_array_nsnumber_factories = {
+    typecode: (_msg_send_for_types(objc_id, [argtype]), SEL(selector))
+    for argtype, selector, typecodes in [
+        (c_bool, "numberWithBool:", "?"),
+        (c_longlong, "numberWithLongLong:", "bhilq"),
+        (c_ulonglong, "numberWithUnsignedLongLong:", "BHILQ"),
+        (c_float, "numberWithFloat:", "f"),
+        (c_double, "numberWithDouble:", "d"),
+    ]
+    for typecode in typecodes
+}
+
+
+def py_array_from_ns(nsobj, typecode=None):
+    """Convert an [`NSArray`][rubicon.objc.api.NSArray] of
+    [`NSNumber`][rubicon.objc.api.NSNumber]s into an [`array.array`][].
+
+    This is much faster than converting the elements one at a time with
+    [`py_from_ns`][rubicon.objc.api.py_from_ns]: the elements are copied out of the
+    array with a single message, and each element is read with a single message,
+    without creating a Python object for any `NSNumber`.
+
+    `typecode` is the [`array.array`][] typecode of the result, and must be one of the
+    integer or floating point typecodes. Elements are converted in the same way as
+    by Objective-C: floating point numbers are truncated when read into an integer
+    array, and an [`OverflowError`][] is raised if an element doesn't fit the
+    typecode. If `typecode` is not given, it is chosen from the types of the
+    elements: `"d"` if any element contains a floating point number, `"Q"` if every
+    element contains an unsigned integer, otherwise `"q"`.
+
+    `nsobj` can also be an [`NSData`][rubicon.objc.api.NSData] containing packed
+    numbers, as created by
+    [`ns_from_py_array`][rubicon.objc.api.ns_from_py_array] with `packed=True`. In
+    that case, `typecode` is required, and the contents are copied into the result
+    as-is.
+
+    The result can be used as a NumPy array without copying, using
+    `numpy.frombuffer`.
+    """
+    if isinstance(nsobj, ObjCInstance):
+        ptr = nsobj.ptr
+    else:
+        ptr = nsobj
+
+    if typecode is not None and typecode not in _array_nsnumber_accessors:
+        raise ValueError(
+            f"Unsupported typecode {typecode!r}; must be one of "
+            f"{''.join(_array_nsnumber_accessors)!r}"
+        )
+
+    if _is_nsdata(ptr):
+        if typecode is None:
+            raise TypeError("A typecode is required to convert NSData to an array")
+        result = array.array(typecode)
+        length = send_message(ptr, "length", restype=NSUInteger, argtypes=[])
+        if length % result.itemsize:
+            raise ValueError(
+                f"NSData of length {length} is not a multiple of the item size "
+                f"({result.itemsize}) of typecode {typecode!r}"
+            )
+        if length:
+            address = send_message(ptr, "bytes", restype=c_void_p, argtypes=[])
+            result.frombytes((c_uint8 * length).from_address(address))
+        return result
+
+    if not send_message(
+        ptr, "isKindOfClass:", NSArray, restype=c_bool, argtypes=[objc_id]
+    ):
+        raise TypeError("Only an NSArray or NSData can be converted to an array")
+
+    count = send_message(ptr, "count", restype=NSUInteger, argtypes=[])
+    objects = (objc_id * count)()
+    send_message(
+        ptr,
+        "getObjects:range:",
+        objects,
+        NSRange(0, count),
+        restype=None,
+        argtypes=[POINTER(objc_id), NSRange],
+    )
+
+    # Check each distinct class of the elements once, rather than every element.
+    for objcclass in {libobjc.object_getClass(obj).value for obj in objects}:
+        if not send_message(
+            Class(objcclass),
+            "isSubclassOfClass:",
+            NSNumber,
+            restype=c_bool,
+            argtypes=[objc_id],
+        ):
+            raise TypeError(
+                "Only an NSArray containing NSNumbers can be converted to an array"
+            )
+
+    if typecode is None:
+        send, selector = _nsnumber_objctype
+        encodings = {send(obj, selector) for obj in objects}
+        if encodings & {b"f", b"d"}:
+            typecode = "d"
+        elif encodings and encodings <= {b"C", b"S", b"I", b"L", b"Q"}:
+            typecode = "Q"
+        else:
+            typecode = "q"
+
+    send, selector = _array_nsnumber_accessors[typecode]
+    return array.array(typecode, [send(obj, selector) for obj in objects])
+
+
+def ns_from_py_array(buffer, *, packed=False):
+    """Convert a buffer of numbers, such as an [`array.array`][] or a NumPy array, into
+    an [`NSArray`][rubicon.objc.api.NSArray] of
+    [`NSNumber`][rubicon.objc.api.NSNumber]s.
+
+    The returned object is autoreleased.
+
+    `buffer` can be any object supporting the buffer protocol with a native integer,
+    floating point or [`bool`][] format (the formats supported by [`struct`][] without
+    a byte order prefix). Multidimensional and non-contiguous buffers are flattened
+    in C order. This is much faster than converting a [`list`][] with
+    [`ns_from_py`][rubicon.objc.api.ns_from_py], because no Python object needs to be
+    classified, and the `NSArray` is created with a single message.
+
+    If `packed` is true, the numbers are copied into an
+    [`NSData`][rubicon.objc.api.NSData] as-is instead, without creating an `NSNumber`
+    for each of them. This is useful for Foundation APIs that accept raw bytes, and
+    can be converted back using
+    [`py_array_from_ns`][rubicon.objc.api.py_array_from_ns].
+    """
+    view = memoryview(buffer)
+    typecode = view.format.removeprefix("@")
+    if typecode not in _array_nsnumber_factories:
         raise TypeError(
-            f"Don't know how to convert a "
-            f"{type(pyobj).__module__}.{type(pyobj).__qualname__} to a Foundation "
-            f"object"
+            f"Unsupported buffer format {view.format!r}; must be one of "
+            f"{''.join(_array_nsnumber_factories)!r}"
+        )
+
+    if packed:
+        return ObjCInstance(_nsdata_ptr_from_buffer(view, no_copy=False))
+
+    if view.ndim != 1 or not view.c_contiguous:
+        view = memoryview(view.tobytes()).cast(typecode)
+
+    send, selector = _array_nsnumber_factories[typecode]
+    count = len(view)
+    objects = (objc_id * count)(
+        *[send(NSNumber.ptr, selector, value) for value in view.tolist()]
+    )
+    return ObjCInstance(
+        send_message(
+            NSMutableArray,
+            "arrayWithObjects:count:",
+            objects,
+            count,
+            restype=objc_id,
+            argtypes=[POINTER(objc_id), NSUInteger],
         )
+    )
 
 
 at = ns_from_py
@@ -1,4 +1,6 @@
+import collections.abc
 import operator
+from ctypes import POINTER
 
 from .api import (
     NSArray,
@@ -6,14 +8,23 @@ from .api import (
     NSMutableArray,
     NSMutableDictionary,
     NSString,
+    ObjCClass,
     ObjCInstance,
+    _converter_for_objcclass_cache,
+    _py_from_ns_ptr,
+    _py_from_nsarray,
+    _py_from_nsdictionary,
+    _str_from_nsstring_ptr,
+    converter_for_objcclass,
     for_objcclass,
     ns_from_py,
     py_from_ns,
 )
-from .runtime import objc_id, send_message
+from .runtime import libobjc, objc_id, send_message
 from .types import NSNotFound, NSRange, NSUInteger, unichar
 
+NSMutableIndexSet = ObjCClass("NSMutableIndexSet")
+
 # All NSComparisonResult values.
 NSOrderedAscending = -1
 NSOrderedSame = 0
@@ -40,7 +51,7 @@ class ObjCStrInstance(ObjCInstance):
     """
 
     def __str__(self):
-        return self.UTF8String.decode("utf-8")
+        return _str_from_nsstring_ptr(self.ptr)
 
     def __fspath__(self):
         return self.__str__()
@@ -211,6 +222,118 @@ class ObjCStrInstance(ObjCInstance):
             return getattr(self.__str__(), attr)
 
 
+# The largest slice step for which the elements of an extended slice are copied out
+# of the array in one message, together with the elements in between. For larger
+# steps, only the selected elements are fetched, one message each.
+_DENSE_SLICE_MAX_STEP = 64
+
+
+def _objects_in_range(ptr, location, length):
+    """Copy the pointers to the elements in a range of an NSArray out of it with a
+    single message."""
+    objects = (objc_id * length)()
+    send_message(
+        ptr,
+        "getObjects:range:",
+        objects,
+        NSRange(location, length),
+        restype=None,
+        argtypes=[POINTER(objc_id), NSRange],
+    )
+    return objects
+
+
+def _objects_in_slice(ptr, indices):
+    """Get the pointers to the elements of an NSArray at the indices in a range."""
+    if len(indices) == 0:
+        return []
+    elif abs(indices.step) <= _DENSE_SLICE_MAX_STEP:
+        first = min(indices[0], indices[-1])
+        last = max(indices[0], indices[-1])
+        objects = _objects_in_range(ptr, first, last - first + 1)
+        return objects[indices[0] - first :: indices.step][: len(indices)]
+    else:
+        return [
+            send_message(
+                ptr, "objectAtIndex:", index, restype=objc_id, argtypes=[NSUInteger]
+            )
+            for index in indices
+        ]
+
+
+def _array_with_objects(nsclass, objects):
+    """Create an autoreleased array of the given class, containing the objects in a
+    sequence of pointers, with a single message."""
+    count = len(objects)
+    return send_message(
+        nsclass,
+        "arrayWithObjects:count:",
+        (objc_id * count)(*objects),
+        count,
+        restype=objc_id,
+        argtypes=[POINTER(objc_id), NSUInteger],
+    )
+
+
+def _replace_objects_in_slice(ptr, indices, objects):
+    """Replace the elements of an NSMutableArray at the indices in a range with the
+    objects in a sequence of pointers (in the same order as the indices), or remove
+    them if `objects` is None.
+
+    Either way, the array is modified with a single message, so that every element
+    after the slice is moved at most once.
+    """
+    if len(indices) == 0:
+        return
+    elif indices.step < 0:
+        indices = indices[::-1]
+        if objects is not None:
+            objects = objects[::-1]
+
+    if indices.step <= _DENSE_SLICE_MAX_STEP:
+        # Replace the whole range covered by the slice with a modified copy of it.
+        location = indices[0]
+        length = indices[-1] - location + 1
+        covered = _objects_in_range(ptr, location, length)[:]
+        if objects is None:
+            del covered[:: indices.step]
+        else:
+            covered[:: indices.step] = objects
+        send_message(
+            ptr,
+            "replaceObjectsInRange:withObjectsFromArray:",
+            NSRange(location, length),
+            _array_with_objects(NSArray, covered),
+            restype=None,
+            argtypes=[NSRange, objc_id],
+        )
+    else:
+        index_set = send_message(
+            NSMutableIndexSet, "indexSet", restype=objc_id, argtypes=[]
+        )
+        for index in indices:
+            send_message(
+                index_set, "addIndex:", index, restype=None, argtypes=[NSUInteger]
+            )
+        if objects is None:
+            send_message(
+                ptr,
+                "removeObjectsAtIndexes:",
+                index_set,
+                restype=None,
+                argtypes=[objc_id],
+            )
+        else:
+            send_message(
+                ptr,
+                "replaceObjectsAtIndexes:withObjects:",
+                index_set,
+                _array_with_objects(NSArray, objects),
+                restype=None,
+                argtypes=[objc_id, objc_id],
+            )
+
+
 @for_objcclass(NSArray)
 class ObjCListInstance(ObjCInstance):
     def __getitem__(self, item):
@@ -219,9 +342,8 @@ class ObjCListInstance(ObjCInstance):
             if step == 1:
                 return self.subarrayWithRange(NSRange(start, stop - start))
             else:
-                return ns_from_py(
-                    [self.objectAtIndex(x) for x in range(start, stop, step)]
-                )
+                objects = _objects_in_slice(self.ptr, range(start, stop, step))
+                return ObjCInstance(_array_with_objects(NSMutableArray, objects))
         else:
             index = (len(self) + item) if item < 0 else item
 
@@ -241,19 +363,65 @@ class ObjCListInstance(ObjCInstance):
         return self.containsObject_(item)
 
     def __eq__(self, other):
-        return list(self) == other
+        if other is self:
+            return True
+        elif isinstance(other, NSArray):
+            return self.isEqualToArray(other)
+        elif isinstance(other, list):
+            if len(other) != len(self):
+                return False
+            return all(a is b or a == b for a, b in zip(self, other, strict=True))
+        else:
+            return list(self) == other
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
-    def index(self, value):
-        idx = self.indexOfObject_(value)
+    def py_view(self):
+        """Get a read-only view of this array (an `ObjCListView`), which converts its
+        elements to Python objects only when they are accessed."""
+        return ObjCListView(self)
+
+    def index(self, value, start=0, stop=None):
+        start, stop, _ = slice(start, stop).indices(len(self))
+        idx = self.indexOfObject(value, inRange=NSRange(start, max(stop - start, 0)))
         if idx == NSNotFound:
             raise ValueError(f"{value!r} is not in list")
         return idx
 
     def count(self, value):
-        return len([x for x in self if x == value])
+        """Count the elements that are equal to `value`.
+
+        Unlike [`list.count`][], elements are compared with `value` using the
+        Objective-C `isEqual:` method.
+        """
+        try:
+            ns_value = ns_from_py(value)
+        except TypeError:
+            # Objects that can't be converted can't be in the array.
+            return 0
+        if ns_value is None:
+            return 0
+
+        # Let Foundation search for each match in turn, so that only the matching
+        # elements need a message from Python.
+        length = len(self)
+        matches = 0
+        start = 0
+        while start < length:
+            idx = send_message(
+                self.ptr,
+                "indexOfObject:inRange:",
+                ns_value,
+                NSRange(start, length - start),
+                restype=NSUInteger,
+                argtypes=[objc_id, NSRange],
+            )
+            if idx == NSNotFound:
+                break
+            matches += 1
+            start = idx + 1
+        return matches
 
     def copy(self):
         return ObjCInstance(send_message(self, "copy", restype=objc_id, argtypes=[]))
@@ -283,8 +451,9 @@ class ObjCMutableListInstance(ObjCListInstance):
                         f"to extended slice of size {len(indices)}"
                     )
 
-                for idx, obj in zip(indices, arr, strict=True):
-                    self.replaceObjectAtIndex(idx, withObject=obj)
+                _replace_objects_in_slice(
+                    self.ptr, indices, _objects_in_range(arr, 0, len(arr))
+                )
         else:
             index = (len(self) + item) if item < 0 else item
 
@@ -299,8 +468,7 @@ class ObjCMutableListInstance(ObjCListInstance):
             if step == 1:
                 self.removeObjectsInRange(NSRange(start, stop - start))
             else:
-                for idx in sorted(range(start, stop, step), reverse=True):
-                    self.removeObjectAtIndex(idx)
+                _replace_objects_in_slice(self.ptr, range(start, stop, step), None)
         else:
             index = (len(self) + item) if item < 0 else item
 
@@ -316,8 +484,10 @@ class ObjCMutableListInstance(ObjCListInstance):
         self.addObject_(value)
 
     def extend(self, values):
-        for value in values:
-            self.addObject_(value)
+        # Convert all values first, then add them with a single message.
+        if not isinstance(values, NSArray) or values is self:
+            values = ns_from_py(list(values))
+        self.addObjectsFromArray(values)
 
     def clear(self):
         self.removeAllObjects()
@@ -355,7 +525,14 @@ class ObjCDictInstance(ObjCInstance):
         return self.objectForKey_(item) is not None
 
     def __eq__(self, other):
-        return py_from_ns(self) == other
+        if other is self:
+            return True
+        elif isinstance(other, NSDictionary):
+            return self.isEqualToDictionary(other)
+        elif isinstance(other, collections.abc.Mapping):
+            return len(other) == len(self) and self.py_view() == other
+        else:
+            return py_from_ns(self) == other
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -373,8 +550,17 @@ class ObjCDictInstance(ObjCInstance):
         return self.allValues()
 
     def items(self):
-        for key in self.allKeys():
-            yield key, self.objectForKey_(key)
+        # Iterate over a snapshot of the keys and values, taken with a single
+        # message, rather than looking up every key. The snapshot keeps them alive
+        # while iterating, even if the dictionary is modified.
+        _snapshot, keys, values = _snapshot_nsdictionary(self.ptr)
+        for key, value in zip(keys, values, strict=True):
+            yield ObjCInstance(key), ObjCInstance(value)
+
+    def py_view(self):
+        """Get a read-only view of this dictionary (an `ObjCDictView`), which
+        converts its values to Python objects only when they are accessed."""
+        return ObjCDictView(self)
 
     def copy(self):
         return ObjCInstance(send_message(self, "copy", restype=objc_id, argtypes=[]))
@@ -388,10 +574,11 @@ class ObjCMutableDictInstance(ObjCDictInstance):
         self.setObject_forKey_(value, item)
 
     def __delitem__(self, item):
-        if item not in self:
+        # Convert the key once, and use it for both the lookup and the removal.
+        key = ns_from_py(item)
+        if self.objectForKey_(key) is None:
             raise KeyError(item)
-
-        self.removeObjectForKey_(item)
+        self.removeObjectForKey_(key)
 
     def copy(self):
         return self.mutableCopy()
@@ -400,14 +587,16 @@ class ObjCMutableDictInstance(ObjCDictInstance):
         self.removeAllObjects()
 
     def pop(self, item, default=no_pop_default):
-        if item not in self:
+        # Convert the key once, and use it for both the lookup and the removal.
+        key = ns_from_py(item)
+        value = self.objectForKey_(key)
+        if value is None:
             if default is not self.no_pop_default:
                 return default
             else:
                 raise KeyError(item)
 
-        value = self.objectForKey_(item)
-        self.removeObjectForKey_(item)
+        self.removeObjectForKey_(key)
         return value
 
     def popitem(self):
@@ -420,16 +609,254 @@ class ObjCMutableDictInstance(ObjCDictInstance):
         return key, value
 
     def setdefault(self, key, default=None):
-        value = self.objectForKey_(key)
+        # Convert the key once, and use it for both the lookup and the insertion.
+        ns_key = ns_from_py(key)
+        value = self.objectForKey_(ns_key)
         if value is None:
             value = default
-        if value is not None:
-            self.setObject_forKey_(default, key)
+            if default is not None:
+                self.setObject_forKey_(default, ns_key)
         return value
 
     def update(self, new=None, **kwargs):
-        if new is not None:
-            kwargs.update(new)
+        # Convert all keys and values into a dictionary first, then add them with a
+        # single message.
+        if isinstance(new, NSDictionary):
+            if kwargs:
+                self.addEntriesFromDictionary_(ns_from_py(kwargs))
+            self.addEntriesFromDictionary_(new)
+        else:
+            if new is not None:
+                kwargs.update(new)
+            self.addEntriesFromDictionary_(ns_from_py(kwargs))
+
+
+def _snapshot_nsarray(ptr):
+    """Take an immutable copy of an NSArray, and copy the pointers to its elements
+    out of it with a single message.
+
+    Returns the copy (which keeps the elements alive) and the pointers."""
+    snapshot = ObjCInstance(
+        send_message(ptr, "copy", restype=objc_id, argtypes=[]),
+        _implicitly_owned=True,
+    )
+    count = send_message(snapshot, "count", restype=NSUInteger, argtypes=[])
+    return snapshot, _objects_in_range(snapshot, 0, count)
+
+
+def _snapshot_nsdictionary(ptr):
+    """Take an immutable copy of an NSDictionary, and copy the pointers to its keys
+    and values out of it with a single message.
+
+    Returns the copy (which keeps the keys and values alive), the keys and the
+    values."""
+    snapshot = ObjCInstance(
+        send_message(ptr, "copy", restype=objc_id, argtypes=[]),
+        _implicitly_owned=True,
+    )
+    count = send_message(snapshot, "count", restype=NSUInteger, argtypes=[])
+    keys = (objc_id * count)()
+    values = (objc_id * count)()
+    send_message(
+        snapshot,
+        "getObjects:andKeys:count:",
+        values,
+        keys,
+        count,
+        restype=None,
+        argtypes=[POINTER(objc_id), POINTER(objc_id), NSUInteger],
+    )
+    return snapshot, keys, values
+
+
+# Placeholder for the elements of a view that haven't been converted yet.
+_unconverted = object()
+
+
+def _py_view_from_ns_ptr(ptr):
+    """Convert an element of a view to a Python object.
+
+    Objects that [`py_from_ns`][rubicon.objc.api.py_from_ns] would convert with the
+    built-in array and dictionary converters are converted to views instead, so that
+    their contents are also only converted when they are accessed. All other objects
+    are converted using the converter registered for their class.
+    """
+    objcclass = libobjc.object_getClass(ptr)
+    try:
+        converter = _converter_for_objcclass_cache[objcclass.value]
+    except KeyError:
+        converter = converter_for_objcclass(objcclass)
+
+    if converter is _py_from_nsarray:
+        return ObjCListView(ptr)
+    elif converter is _py_from_nsdictionary:
+        return ObjCDictView(ptr)
+    elif converter is None:
+        return ObjCInstance(ptr)
+    else:
+        return converter(ptr)
+
+
+class ObjCListView(collections.abc.Sequence):
+    """A read-only view of an [`NSArray`][rubicon.objc.api.NSArray], which behaves like
+    a [`list`][] of the array's elements converted to Python objects.
+
+    Unlike [`py_from_ns`][rubicon.objc.api.py_from_ns], which converts the whole array
+    at once, the view converts each element the first time it is accessed, and keeps
+    the converted element for later accesses. Nested arrays and dictionaries are
+    converted to views as well.
+
+    The view is created from a snapshot of the array, so it isn't affected by later
+    changes to an `NSMutableArray`. Views are usually created using the `py_view()`
+    method of an `NSArray`.
+
+    Comparing a view to another view or a [`list`][] compares the lengths first, and
+    only converts elements if the lengths are equal. Elements that are the same
+    Objective-C object in both views are not converted at all.
+    """
+
+    __slots__ = ("_array", "_items", "_objects")
+
+    def __init__(self, nsarray):
+        self._array, self._objects = _snapshot_nsarray(nsarray)
+        self._items = [_unconverted] * len(self._objects)
+
+    def _item(self, index):
+        item = self._items[index]
+        if item is _unconverted:
+            item = self._items[index] = _py_view_from_ns_ptr(self._objects[index])
+        return item
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._item(index) for index in range(*item.indices(len(self)))]
+        else:
+            index = operator.index(item)
+            if index < 0:
+                index += len(self)
+
+            if index not in range(len(self)):
+                raise IndexError(f"{type(self).__name__} index out of range")
+
+            return self._item(index)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._item(index)
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        elif isinstance(other, NSArray):
+            return self._array.isEqualToArray(other)
+        elif isinstance(other, ObjCListView):
+            if len(other) != len(self):
+                return False
+            return all(
+                self._objects[index].value == other._objects[index].value
+                or self._item(index) == other._item(index)
+                for index in range(len(self))
+            )
+        elif isinstance(other, list):
+            if len(other) != len(self):
+                return False
+            return all(a is b or a == b for a, b in zip(self, other, strict=True))
+        else:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class ObjCDictView(collections.abc.Mapping):
+    """A read-only view of an [`NSDictionary`][rubicon.objc.api.NSDictionary], which
+    behaves like a [`dict`][] of the dictionary's keys and values converted to Python
+    objects.
+
+    The keys are converted the first time the view is used. Each value is converted
+    the first time it is accessed, and the converted value is kept for later
+    accesses. Nested arrays and dictionaries are converted to views as well.
+
+    The view is created from a snapshot of the dictionary, taken with a single
+    message, so it isn't affected by later changes to an `NSMutableDictionary`, and
+    iterating over its items doesn't send any messages. Views are usually created
+    using the `py_view()` method of an `NSDictionary`.
+
+    Comparing a view to another mapping compares the lengths first, and only
+    converts values if the lengths are equal. Values that are the same Objective-C
+    object in both views are not converted at all.
+    """
+
+    __slots__ = ("_dict", "_index", "_items", "_keys", "_values")
+
+    def __init__(self, nsdictionary):
+        self._dict, self._keys, self._values = _snapshot_nsdictionary(nsdictionary)
+        self._items = [_unconverted] * len(self._values)
+        self._index = None
+
+    def _key_index(self):
+        """The position of each key in the snapshot, keyed by the converted key."""
+        if self._index is None:
+            self._index = {
+                _py_from_ns_ptr(key): index for index, key in enumerate(self._keys)
+            }
+        return self._index
+
+    def _item(self, index):
+        item = self._items[index]
+        if item is _unconverted:
+            item = self._items[index] = _py_view_from_ns_ptr(self._values[index])
+        return item
+
+    def __getitem__(self, key):
+        return self._item(self._key_index()[key])
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._key_index())
+
+    def __contains__(self, key):
+        return key in self._key_index()
+
+    def _same_value(self, index, other, other_index):
+        """Check whether a value of this view is equal to a value of another view,
+        without converting them if they are the same Objective-C object."""
+        return self._values[index].value == other._values[
+            other_index
+        ].value or self._item(index) == other._item(other_index)
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        elif isinstance(other, NSDictionary):
+            return self._dict.isEqualToDictionary(other)
+        elif isinstance(other, ObjCDictView):
+            if len(other) != len(self):
+                return False
+            other_index = other._key_index()
+            return all(
+                key in other_index and self._same_value(index, other, other_index[key])
+                for key, index in self._key_index().items()
+            )
+        elif isinstance(other, collections.abc.Mapping):
+            if len(other) != len(self):
+                return False
+            for key, index in self._key_index().items():
+                try:
+                    value = other[key]
+                except KeyError:
+                    return False
+                item = self._item(index)
+                if not (item is value or item == value):
+                    return False
+            return True
+        else:
+            return NotImplemented
 
-        for k, v in kwargs.items():
-            self.setObject_forKey_(v, k)
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
@@ -4,6 +4,7 @@ import contextvars
 import inspect
 import sys
 import threading
+import time
 import warnings
 from asyncio import (
     coroutines,
@@ -11,10 +12,19 @@ from asyncio import (
     tasks,
     unix_events,
 )
-from ctypes import CFUNCTYPE, POINTER, Structure, c_double, c_int, c_ulong, c_void_p
+from ctypes import (
+    CFUNCTYPE,
+    POINTER,
+    Structure,
+    c_bool,
+    c_double,
+    c_int,
+    c_ulong,
+    c_void_p,
+)
 
 from .api import ObjCClass, objc_const
-from .runtime import load_library, objc_id
+from .runtime import flush_deferred_releases, libobjc, load_library, objc_id
 from .types import CFIndex, NSMakePoint
 
 if sys.version_info < (3, 14):  # pragma: no-cover-if-gte-py314
@@ -50,6 +60,7 @@ else:  # pragma: no-cover-if-lt-py316
     pass
 
 __all__ = [
+    "AutoreleasePoolMetrics",
     "CocoaLifecycle",
     "EventLoopPolicy",
     "RubiconEventLoop",
@@ -75,6 +86,12 @@ CFRunLoopRef = objc_id
 CFRunLoopMode = CFStringRef
 CFRunLoopSourceRef = objc_id
 
+CFRunLoopActivity = CFOptionFlags
+CFRunLoopObserverRef = objc_id
+CFRunLoopObserverCallBack = CFUNCTYPE(
+    None, CFRunLoopObserverRef, CFRunLoopActivity, c_void_p
+)
+
 CFRunLoopTimerRef = objc_id
 CFRunLoopTimerCallBack = CFUNCTYPE(None, CFRunLoopTimerRef, c_void_p)
 
@@ -104,6 +121,13 @@ class CFRunLoopTimerContext(Structure):
 
 kCFRunLoopCommonModes = objc_const(libcf, "kCFRunLoopCommonModes")
 
+kCFRunLoopEntry = 1 << 0
+kCFRunLoopBeforeTimers = 1 << 1
+kCFRunLoopBeforeSources = 1 << 2
+kCFRunLoopBeforeWaiting = 1 << 5
+kCFRunLoopAfterWaiting = 1 << 6
+kCFRunLoopExit = 1 << 7
+
 kCFSocketNoCallBack = 0
 kCFSocketReadCallBack = 1
 kCFSocketAcceptCallBack = 2
@@ -146,6 +170,13 @@ libcf.CFRelease.argtypes = [CFTypeRef]
 libcf.CFRetain.restype = CFTypeRef
 libcf.CFRetain.argtypes = [CFTypeRef]
 
+libcf.CFRunLoopAddObserver.restype = None
+libcf.CFRunLoopAddObserver.argtypes = [
+    CFRunLoopRef,
+    CFRunLoopObserverRef,
+    CFRunLoopMode,
+]
+
 libcf.CFRunLoopAddSource.restype = None
 libcf.CFRunLoopAddSource.argtypes = [CFRunLoopRef, CFRunLoopSourceRef, CFRunLoopMode]
 
@@ -158,6 +189,19 @@ libcf.CFRunLoopGetMain.argtypes = []
 libcf.CFRunLoopGetCurrent.restype = CFRunLoopRef
 libcf.CFRunLoopGetCurrent.argtypes = []
 
+libcf.CFRunLoopObserverCreate.restype = CFRunLoopObserverRef
+libcf.CFRunLoopObserverCreate.argtypes = [
+    CFAllocatorRef,
+    CFOptionFlags,
+    c_bool,
+    CFIndex,
+    CFRunLoopObserverCallBack,
+    c_void_p,
+]
+
+libcf.CFRunLoopObserverInvalidate.restype = None
+libcf.CFRunLoopObserverInvalidate.argtypes = [CFRunLoopObserverRef]
+
 libcf.CFRunLoopRemoveSource.restype = None
 libcf.CFRunLoopRemoveSource.argtypes = [CFRunLoopRef, CFRunLoopSourceRef, CFRunLoopMode]
 
@@ -215,7 +259,7 @@ class CFTimerHandle(events.TimerHandle):
     def _cf_timer_callback(self, callback, args):
         # Create a CF-compatible callback for a timer event
         def cf_timer_callback(cftimer, extra):
-            callback(*args)
+            self._loop._run_callback(callback, args)
             # Deregister the callback after it has been performed.
             self._loop._timers.discard(self)
 
@@ -283,7 +327,7 @@ class CFSocketHandle(events.Handle):
             callback = None
 
         if callback:
-            callback(*args)
+            self._loop._run_callback(callback, args)
 
     def __init__(self, *, loop, fd):
         """Register a file descriptor with the CFRunLoop, or modify its state so that
@@ -373,6 +417,34 @@ def context_callback(context, callback):
     return _callback
 
 
+class AutoreleasePoolMetrics:
+    """Statistics about the autorelease pools that an event loop has drained.
+
+    Available as the `autorelease_metrics` attribute of the event loop.
+
+    The Objective-C runtime doesn't provide a way to count the objects in an
+    autorelease pool, so the size of a pool is measured by the number of callbacks
+    that ran while it was open.
+    """
+
+    def __init__(self):
+        # The number of pools that have been drained.
+        self.pools = 0
+        # The number of callbacks that have run in the drained pools.
+        self.callbacks = 0
+        # The largest number of callbacks that have run in a single pool.
+        self.max_callbacks = 0
+        # The longest time that a single pool was open, in seconds.
+        self.max_duration = 0.0
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__qualname__}: {self.pools} pools, "
+            f"{self.callbacks} callbacks, max {self.max_callbacks} callbacks "
+            f"and {self.max_duration:.3f} s per pool>"
+        )
+
+
 class CFEventLoop(unix_events.SelectorEventLoop):
     def __init__(self, lifecycle=None):
         self._lifecycle = lifecycle
@@ -383,6 +455,21 @@ class CFEventLoop(unix_events.SelectorEventLoop):
         self._accept_futures = {}
         self._sockets = {}
 
+        # The autorelease pool policy; see set_autorelease_policy.
+        self._autorelease_callbacks = 1
+        self._autorelease_interval = None
+        self._autorelease_observer = None
+        self._autorelease_observer_callback = None
+        # The autorelease pool shared by several callbacks, if one is open; the
+        # number of callbacks that have run in it; and the time it was opened.
+        self._autorelease_pool = None
+        self._autorelease_pool_callbacks = 0
+        self._autorelease_pool_start = 0.0
+        # The number of callbacks that are currently running. Callbacks that run
+        # inside another callback (in a nested run loop) always get their own pool.
+        self._callback_depth = 0
+        self.autorelease_metrics = AutoreleasePoolMetrics()
+
         super().__init__()
 
     def __del__(self):
@@ -453,6 +540,136 @@ class CFEventLoop(unix_events.SelectorEventLoop):
         """
         self._remove_writer(fd)
 
+    ######################################################################
+    # Autorelease pools
+    ######################################################################
+    def set_autorelease_policy(self, callbacks=1, interval=None):
+        """Set how often the autorelease pools around callbacks are drained.
+
+        Every callback that the event loop runs is run inside an autorelease pool, so
+        that the objects it autoreleases are released even if the run loop doesn't
+        manage autorelease pools itself (for example, when it isn't run by
+        [`CocoaLifecycle`][rubicon.objc.eventloop.CocoaLifecycle]). By default, each
+        callback gets its own pool, which is drained as soon as the callback returns.
+
+        When many short callbacks run, draining a pool after every one of them adds
+        overhead. Instead, a pool can be shared by the callbacks of several
+        iterations of the run loop. It is drained between two iterations once
+        `callbacks` callbacks have run in it, or once it has been open for `interval`
+        seconds. If `callbacks` is None, only `interval` limits the size of a pool.
+        A shared pool is also drained whenever the run loop goes to sleep waiting for
+        events, or exits.
+
+        The pools that have been drained are recorded in `autorelease_metrics`, an
+        [`AutoreleasePoolMetrics`][rubicon.objc.eventloop.AutoreleasePoolMetrics]
+        object.
+        """
+        if callbacks is not None and callbacks < 1:
+            raise ValueError("callbacks must be at least 1, or None")
+        if interval is not None and interval <= 0:
+            raise ValueError("interval must be positive, or None")
+
+        self._autorelease_callbacks = callbacks
+        self._autorelease_interval = interval
+
+        if callbacks != 1 and self._autorelease_observer is None:
+            # Shared pools are opened and closed by an observer of the run loop, so
+            # that they're never left open while the run loop waits for events. The
+            # observer is kept when switching back to one pool per callback, since a
+            # shared pool may still be open.
+            self._autorelease_observer_callback = CFRunLoopObserverCallBack(
+                self._autorelease_observer_fired
+            )
+            self._autorelease_observer = libcf.CFRunLoopObserverCreate(
+                kCFAllocatorDefault,
+                kCFRunLoopEntry
+                | kCFRunLoopBeforeTimers
+                | kCFRunLoopBeforeSources
+                | kCFRunLoopBeforeWaiting
+                | kCFRunLoopAfterWaiting
+                | kCFRunLoopExit,
+                True,  # repeats
+                # Run after AppKit opens its own pool, and before it drains it.
+                0,  # order
+                self._autorelease_observer_callback,
+                None,  # context
+            )
+            libcf.CFRunLoopAddObserver(
+                self._cfrunloop, self._autorelease_observer, kCFRunLoopCommonModes
+            )
+
+    def _autorelease_observer_fired(self, observer, activity, info):
+        # Shared pools are only opened and drained here, between the callouts of the
+        # run loop, so that they're properly nested with any pools that the run loop
+        # (or AppKit) manages around them.
+        if self._callback_depth:
+            # A nested run loop, started by a callback.
+            return
+
+        if activity & (kCFRunLoopBeforeWaiting | kCFRunLoopExit):
+            self._close_autorelease_pool()
+        else:
+            if self._autorelease_pool is not None and self._autorelease_pool_full():
+                self._close_autorelease_pool()
+            if self._autorelease_pool is None and self._autorelease_callbacks != 1:
+                self._open_autorelease_pool()
+
+    def _autorelease_pool_full(self):
+        return (
+            self._autorelease_callbacks is not None
+            and self._autorelease_pool_callbacks >= self._autorelease_callbacks
+        ) or (
+            self._autorelease_interval is not None
+            and time.perf_counter() - self._autorelease_pool_start
+            >= self._autorelease_interval
+        )
+
+    def _open_autorelease_pool(self):
+        self._autorelease_pool = libobjc.objc_autoreleasePoolPush()
+        self._autorelease_pool_callbacks = 0
+        self._autorelease_pool_start = time.perf_counter()
+
+    def _close_autorelease_pool(self):
+        if self._autorelease_pool is None:
+            return
+
+        pool, self._autorelease_pool = self._autorelease_pool, None
+        self._drain_autorelease_pool(
+            pool, self._autorelease_pool_callbacks, self._autorelease_pool_start
+        )
+
+    def _drain_autorelease_pool(self, pool, callbacks, start):
+        # As in runtime.autoreleasepool, deferred releases are flushed into the pool.
+        flush_deferred_releases()
+        libobjc.objc_autoreleasePoolPop(pool)
+
+        metrics = self.autorelease_metrics
+        metrics.pools += 1
+        metrics.callbacks += callbacks
+        metrics.max_callbacks = max(metrics.max_callbacks, callbacks)
+        metrics.max_duration = max(metrics.max_duration, time.perf_counter() - start)
+
+    def _run_callback(self, callback, args):
+        """Run a callback inside an autorelease pool, according to the autorelease
+        policy."""
+        if self._autorelease_pool is None or self._callback_depth:
+            pool = libobjc.objc_autoreleasePoolPush()
+            start = time.perf_counter()
+            self._callback_depth += 1
+            try:
+                callback(*args)
+            finally:
+                self._callback_depth -= 1
+                self._drain_autorelease_pool(pool, 1, start)
+            return
+
+        self._callback_depth += 1
+        try:
+            callback(*args)
+        finally:
+            self._callback_depth -= 1
+            self._autorelease_pool_callbacks += 1
+
     ######################################################################
     # Lifecycle and execution
     ######################################################################
@@ -663,6 +880,11 @@ class CFEventLoop(unix_events.SelectorEventLoop):
             handler = self._timers.pop()
             handler.cancel()
 
+        if self._autorelease_observer is not None:
+            libcf.CFRunLoopObserverInvalidate(self._autorelease_observer)
+            libcf.CFRelease(self._autorelease_observer)
+            self._autorelease_observer = None
+
         super().close()
 
     def _set_lifecycle(self, lifecycle):
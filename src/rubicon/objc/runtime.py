@@ -1,4 +1,6 @@
+import array
 import os
+import threading
 import warnings
 from contextlib import contextmanager
 from ctypes import (
@@ -50,6 +52,9 @@ __all__ = [
     "add_ivar",
     "add_method",
     "autoreleasepool",
+    "disable_deferred_releases",
+    "enable_deferred_releases",
+    "flush_deferred_releases",
     "get_class",
     "get_ivar",
     "libc",
@@ -241,6 +246,10 @@ class SEL(c_void_p):
 
     (The normal arguments supported by [`c_void_p`][ctypes.c_void_p] are
     still accepted.)
+
+    Selectors created from a name are cached, and the same
+    [`SEL`][rubicon.objc.runtime.SEL] object is returned every time the same name is
+    passed. These objects should not be modified.
     """
 
     @property
@@ -254,8 +263,14 @@ class SEL(c_void_p):
     def __new__(cls, init=None):
         # See class docstring for usage details.
         if isinstance(init, (bytes, str)):
+            try:
+                return _selectors[init]
+            except KeyError:
+                pass
+
             self = libobjc.sel_registerName(ensure_bytes(init))
             self._inited = True
+            _selectors[init] = self
             return self
         else:
             self = super().__new__(cls, init)
@@ -273,6 +288,11 @@ class SEL(c_void_p):
         )
 
 
+# Mapping of selector name (as str or bytes) -> SEL. Selectors are never unregistered,
+# so the entries never become invalid.
+_selectors = {}
+
+
 @with_preferred_encoding(b"#")
 class Class(objc_id):
     # This documentation is duplicated in the runtime typing stub. Ensure both
@@ -495,6 +515,12 @@ libobjc.method_setImplementation.argtypes = [Method, IMP]
 libobjc.objc_allocateClassPair.restype = Class
 libobjc.objc_allocateClassPair.argtypes = [Class, c_char_p, c_size_t]
 
+# id objc_autorelease(id value)
+# Restype is c_void_p rather than objc_id, so that no objc_id is created for the
+# result, which is always ignored.
+libobjc.objc_autorelease.restype = c_void_p
+libobjc.objc_autorelease.argtypes = [objc_id]
+
 # void *objc_autoreleasePoolPush(void)
 libobjc.objc_autoreleasePoolPush.restype = c_void_p
 libobjc.objc_autoreleasePoolPush.argtypes = []
@@ -558,10 +584,19 @@ if __i386__ or __x86_64__:
 libobjc.objc_registerClassPair.restype = None
 libobjc.objc_registerClassPair.argtypes = [Class]
 
+# void objc_release(id value)
+libobjc.objc_release.restype = None
+libobjc.objc_release.argtypes = [objc_id]
+
 # void objc_removeAssociatedObjects(id object)
 libobjc.objc_removeAssociatedObjects.restype = None
 libobjc.objc_removeAssociatedObjects.argtypes = [objc_id]
 
+# id objc_retain(id value)
+# See objc_autorelease for the restype.
+libobjc.objc_retain.restype = c_void_p
+libobjc.objc_retain.argtypes = [objc_id]
+
 # void objc_setAssociatedObject(id object, void *key, id value,
 #     objc_AssociationPolicy policy)
 libobjc.objc_setAssociatedObject.restype = None
@@ -740,6 +775,13 @@ def ensure_bytes(x):
     return x.encode("utf-8")
 
 
+# Register the selectors that Rubicon sends on hot paths, like retain and release, once
+# at import time.
+for _name in ["alloc", "autorelease", "copy", "count", "init", "release", "retain"]:
+    SEL(_name)
+del _name
+
+
 ######################################################################
 
 
@@ -843,6 +885,15 @@ def _msg_send_for_types(restype, argtypes):
         return send
 
 
+def _annotate_argument_error(error, selector, argtypes):
+    """Add the selector and the expected argument types to the message of an
+    [`ArgumentError`][ctypes.ArgumentError] raised by an `objc_msgSend` call."""
+    err = error.args[0]
+    sel = selector.name.decode(errors="backslashreplace")
+    valid_args = ", ".join(t.__name__ for t in argtypes)
+    error.args = [f"{sel} {err}; argtypes: {valid_args}"]
+
+
 def send_message(receiver, selector, *args, restype, argtypes=None, varargs=None):
     """Call a method on the receiver with the given selector and arguments.
 
@@ -928,11 +979,7 @@ def send_message(receiver, selector, *args, restype, argtypes=None, varargs=None
     try:
         result = send(receiver, selector, *args, *varargs)
     except ArgumentError as error:
-        # Add more useful info to the default error message, then reraise.
-        err = error.args[0]
-        sel = selector.name.decode(errors="backslashreplace")
-        valid_args = ", ".join(t.__name__ for t in argtypes)
-        error.args = [f"{sel} {err}; argtypes: {valid_args}"]
+        _annotate_argument_error(error, selector, argtypes)
         raise
 
     if restype == c_void_p:
@@ -1091,6 +1138,10 @@ def send_super(
 # handling.)
 _keep_alive_imps = []
 
+# Functions that are called with the class whenever add_method has added or replaced a
+# method. The high-level API uses this to invalidate its method caches.
+_add_method_hooks = []
+
 
 def add_method(cls, selector, method, encoding, replace=False):
     """Add a new instance method to the given class.
@@ -1137,6 +1188,10 @@ def add_method(cls, selector, method, encoding, replace=False):
             raise ValueError(f"A method with the name {selector.name!r} already exists")
 
     _keep_alive_imps.append(imp)
+
+    for hook in _add_method_hooks:
+        hook(cls)
+
     return imp
 
 
@@ -1241,4 +1296,104 @@ def autoreleasepool():
     try:
         yield
     finally:
+        flush_deferred_releases()
         libobjc.objc_autoreleasePoolPop(pool)
+
+
+# The array typecode for unsigned integers of the same size as a pointer.
+_POINTER_TYPECODE = next(
+    typecode for typecode in "LQI" if array.array(typecode).itemsize == sizeof(c_void_p)
+)
+
+# Addresses of the objects whose release has been deferred, or None if deferred
+# releases are disabled. The lock is re-entrant, because a garbage collection (which
+# can defer further releases) can happen at almost any time.
+_deferred_releases = None
+_deferred_releases_lock = threading.RLock()
+
+
+def _defer_release(address):
+    """Add the object at `address` to the deferred release queue.
+
+    Returns False, without doing anything, if deferred releases are disabled.
+    """
+    with _deferred_releases_lock:
+        if _deferred_releases is None:
+            return False
+        _deferred_releases.append(address)
+        return True
+
+
+def enable_deferred_releases():
+    """Defer releasing Objective-C objects when their Python wrappers are garbage
+    collected.
+
+    Normally, an [`ObjCInstance`][rubicon.objc.api.ObjCInstance] autoreleases its
+    object as soon as the wrapper is garbage collected. When many wrappers are
+    collected at once, for example when a large list or a reference cycle is freed,
+    this sends many individual messages. With deferred releases enabled, the objects
+    are instead collected in a queue, and autoreleased all at once by
+    [`flush_deferred_releases`][rubicon.objc.runtime.flush_deferred_releases]. This
+    also means that wrappers can be garbage collected on threads that don't have an
+    autorelease pool.
+
+    The objects are autoreleased into the autorelease pool that is current when the
+    queue is flushed, so an object that is only owned by its wrapper (for example,
+    one that was returned to Objective-C by a factory method) stays alive until that
+    pool is drained, just as it would without deferred releases. The queue must
+    therefore only be flushed while an autorelease pool is active.
+
+    The queue is flushed when an
+    [`autoreleasepool`][rubicon.objc.runtime.autoreleasepool] block exits, and after
+    each callback run by Rubicon's event loop. Code that doesn't use either should
+    call [`flush_deferred_releases`][rubicon.objc.runtime.flush_deferred_releases]
+    regularly.
+    """
+    global _deferred_releases
+
+    with _deferred_releases_lock:
+        if _deferred_releases is None:
+            _deferred_releases = array.array(_POINTER_TYPECODE)
+
+
+def disable_deferred_releases():
+    """Release Objective-C objects as soon as their Python wrappers are garbage
+    collected again, after autoreleasing any objects whose release has been
+    deferred."""
+    global _deferred_releases
+
+    with _deferred_releases_lock:
+        pending, _deferred_releases = _deferred_releases, None
+
+    if pending:
+        _release_all(pending)
+
+
+def flush_deferred_releases():
+    """Autorelease all Objective-C objects whose release has been deferred, into
+    the current autorelease pool.
+
+    See [`enable_deferred_releases`][rubicon.objc.runtime.enable_deferred_releases].
+    This function does nothing if deferred releases are not enabled.
+    """
+    global _deferred_releases
+
+    # Checking without the lock is fine: the queue is flushed regularly anyway.
+    if not _deferred_releases:
+        return
+
+    queue = array.array(_POINTER_TYPECODE)
+    with _deferred_releases_lock:
+        if _deferred_releases is None:
+            return
+        pending, _deferred_releases = _deferred_releases, queue
+
+    _release_all(pending)
+
+
+def _release_all(addresses):
+    # The objects are autoreleased rather than released, as in ObjCInstance.__del__,
+    # so that none of them is deallocated before the current pool is drained.
+    autorelease = libobjc.objc_autorelease
+    for address in addresses:
+        autorelease(address)
@@ -1,4 +1,5 @@
 import collections.abc
+import functools
 import platform
 import struct
 from ctypes import (
@@ -167,66 +168,85 @@ _ctype_for_encoding_map = {}
 _encoding_for_ctype_map = {}
 
 
+# Character classes used by _end_of_encoding. Indexing a bytes object returns an int,
+# so these are sets of ints.
+_OPENING_PARENS = frozenset(b"([{<")
+_CLOSING_PARENS = frozenset(b")]}>")
+_SINGLE_CHARACTER_ENCODINGS = frozenset(b"*:#?BCDILQSTcdfilqstv")
+_PREFIXES = frozenset(b"^ANORVjnor")
+_DIGITS = frozenset(b"0123456789")
+_AT = ord("@")
+_QUESTION_MARK = ord("?")
+_LESS_THAN = ord("<")
+_QUOTE = ord('"')
+_BIT_FIELD = ord("b")
+
+
 def _end_of_encoding(encoding, start):
     """Find the end index of the encoding starting at index start.
 
     The encoding is not validated very extensively. There are no guarantees what happens
     for invalid encodings; an error may be raised, or a bogus end index may be returned.
     """
-    if start < 0 or start >= len(encoding):
-        raise ValueError(f"Start index {start} not in range({len(encoding)})")
+    length = len(encoding)
+    if start < 0 or start >= length:
+        raise ValueError(f"Start index {start} not in range({length})")
 
     paren_depth = 0
 
     i = start
-    while i < len(encoding):
-        c = encoding[i : i + 1]
-        if c in b"([{<":
+    while i < length:
+        c = encoding[i]
+        if c in _OPENING_PARENS:
             # Opening parenthesis of some type, wait for a corresponding closing paren.
             # This doesn't check that the parenthesis *types* match (only the *number*
             # of closing parens has to match).
             paren_depth += 1
             i += 1
         elif paren_depth > 0:
-            if c in b")]}>":
+            if c in _CLOSING_PARENS:
                 # Closing parentheses of some type.
                 paren_depth -= 1
             i += 1
             if paren_depth == 0:
                 # Final closing parenthesis, end of this encoding.
                 return i
-        elif c in b"*:#?BCDILQSTcdfilqstv":
+        elif c in _SINGLE_CHARACTER_ENCODINGS:
             # Encodings with exactly one character.
             return i + 1
-        elif c in b"^ANORVjnor":
+        elif c in _PREFIXES:
             # Simple prefix (qualifier, pointer, etc.), skip it but count it towards
             # the length.
             i += 1
-        elif c == b"@":
-            if encoding[i + 1 : i + 3] == b"?<":
-                # Encoding @?<...> (block with signature).
-                # Skip the @? and continue at the < which is treated as an
-                # opening paren.
-                i += 2
-            elif encoding[i + 1 : i + 2] == b"?":
-                # Encoding @? (block).
-                return i + 2
-            elif encoding[i + 1 : i + 2] == b'"':
+        elif c == _AT:
+            following = encoding[i + 1] if i + 1 < length else None
+            if following == _QUESTION_MARK:
+                if i + 2 < length and encoding[i + 2] == _LESS_THAN:
+                    # Encoding @?<...> (block with signature).
+                    # Skip the @? and continue at the < which is treated as an
+                    # opening paren.
+                    i += 2
+                else:
+                    # Encoding @? (block).
+                    return i + 2
+            elif following == _QUOTE:
                 # Encoding @"..." (object pointer with class name).
                 return encoding.index(b'"', i + 2) + 1
             else:
                 # Encoding @ (untyped object pointer).
                 return i + 1
-        elif c == b"b":
+        elif c == _BIT_FIELD:
             # Bit field, followed by one or more digits.
-            for j in range(i + 1, len(encoding)):
-                if encoding[j] not in b"0123456789":
+            for j in range(i + 1, length):
+                if encoding[j] not in _DIGITS:
                     # Found a non-digit, stop here.
                     return j
             # Reached end of string without finding a non-digit, stop.
-            return len(encoding)
+            return length
         else:
-            raise ValueError(f"Unknown encoding {c} at index {i}: {encoding}")
+            raise ValueError(
+                f"Unknown encoding {encoding[i : i + 1]} at index {i}: {encoding}"
+            )
 
     if paren_depth > 0:
         raise ValueError(
@@ -415,8 +435,13 @@ def register_preferred_encoding(encoding, ctype):
     overwriting existing conversions, use
     [`register_encoding`][rubicon.objc.types.register_encoding].
     """
+    replaced = (
+        encoding in _ctype_for_encoding_map
+        and _ctype_for_encoding_map[encoding] is not ctype
+    )
     _ctype_for_encoding_map[encoding] = ctype
     _encoding_for_ctype_map[ctype] = encoding
+    _encoding_conversion_changed(encoding, replaced)
 
 
 def with_preferred_encoding(encoding):
@@ -444,7 +469,9 @@ def register_encoding(encoding, ctype):
     overwrite existing conversions, use
     [`register_preferred_encoding`][rubicon.objc.types.register_preferred_encoding].
     """
-    _ctype_for_encoding_map.setdefault(encoding, ctype)
+    if encoding not in _ctype_for_encoding_map:
+        _ctype_for_encoding_map[encoding] = ctype
+        _encoding_conversion_changed(encoding, False)
     _encoding_for_ctype_map.setdefault(ctype, encoding)
 
 
@@ -477,7 +504,9 @@ def unregister_encoding(encoding):
 
     If the encoding was not registered previously, nothing happens.
     """
-    _ctype_for_encoding_map.pop(encoding, None)
+    if encoding in _ctype_for_encoding_map:
+        del _ctype_for_encoding_map[encoding]
+        _encoding_conversion_changed(encoding, True)
 
 
 def unregister_encoding_all(encoding):
@@ -489,7 +518,9 @@ def unregister_encoding_all(encoding):
 
     If the encoding was not registered previously, nothing happens.
     """
-    _ctype_for_encoding_map.pop(encoding, None)
+    if encoding in _ctype_for_encoding_map:
+        del _ctype_for_encoding_map[encoding]
+        _encoding_conversion_changed(encoding, True)
     for ct, enc in list(_encoding_for_ctype_map.items()):
         if enc == encoding:
             unregister_ctype_all(ct)
@@ -508,7 +539,7 @@ def unregister_ctype(ctype):
 
     If the C type was not registered previously, nothing happens.
     """
-    _encoding_for_ctype_map.pop(ctype, default=None)
+    _encoding_for_ctype_map.pop(ctype, None)
 
 
 def unregister_ctype_all(ctype):
@@ -521,7 +552,7 @@ def unregister_ctype_all(ctype):
 
     If the C type was not registered previously, nothing happens.
     """
-    _encoding_for_ctype_map.pop(ctype, default=None)
+    _encoding_for_ctype_map.pop(ctype, None)
     for enc, ct in list(_ctype_for_encoding_map.items()):
         if ct == ctype:
             unregister_encoding_all(enc)
@@ -550,14 +581,15 @@ def split_method_encoding(encoding):
     are meaningless on modern architectures.
     """
     encodings = []
+    length = len(encoding)
     start = 0
-    while start < len(encoding):
+    while start < length:
         # Find the end of the current encoding
         end = _end_of_encoding(encoding, start)
         encodings.append(encoding[start:end])
         start = end
         # Skip the legacy stack offsets
-        while start < len(encoding) and encoding[start] in b"0123456789":
+        while start < length and encoding[start] in _DIGITS:
             start += 1
 
     return encodings
@@ -570,8 +602,32 @@ def ctypes_for_method_encoding(encoding):
     [`split_method_encoding`][rubicon.objc.types.split_method_encoding], and
     then converting each individual type encoding using
     [`ctype_for_encoding`][rubicon.objc.types.ctype_for_encoding].
+
+    Results are cached, because many methods share the same signature. The cache is
+    cleared whenever a registered encoding-to-C type conversion that a cached result
+    may depend on changes.
+    """
+    return list(_ctypes_for_method_encoding(encoding))
+
+
+@functools.lru_cache(maxsize=4096)
+def _ctypes_for_method_encoding(encoding):
+    return tuple(ctype_for_encoding(enc) for enc in split_method_encoding(encoding))
+
+
+def _encoding_conversion_changed(encoding, replaced):
+    """Clear the cached method encodings that may depend on the conversion of
+    `encoding`, after it has been added (or, if `replaced` is true, changed or
+    removed).
+
+    Parsing an unregistered encoding registers it, so adding a new encoding can't
+    change any cached result. This includes the structures created while parsing
+    method encodings, which therefore don't clear the cache. The exception is
+    object encodings with a class name or block signature, which are parsed as
+    plain `@` or `@?` without being registered.
     """
-    return [ctype_for_encoding(enc) for enc in split_method_encoding(encoding)]
+    if replaced or encoding.startswith(b"@"):
+        _ctypes_for_method_encoding.cache_clear()
 
 
 def _struct_for_sequence(seq, struct_type):
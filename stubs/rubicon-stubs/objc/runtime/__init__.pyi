@@ -7,6 +7,10 @@ class SEL:
 
     (The normal arguments supported by [`c_void_p`][ctypes.c_void_p] are
     still accepted.)
+
+    Selectors created from a name are cached, and the same
+    [`SEL`][rubicon.objc.runtime.SEL] object is returned every time the same name is
+    passed. These objects should not be modified.
     """
     @property
     def name(self) -> bytes:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import array
+
 import pytest
 
 from rubicon.objc import (
@@ -7,11 +9,13 @@ from rubicon.objc import (
     NSMutableArray,
     NSObject,
     ObjCClass,
+    ns_from_py,
     objc_method,
     objc_property,
     py_from_ns,
 )
-from rubicon.objc.collections import ObjCListInstance
+from rubicon.objc.api import ns_from_py_array, py_array_from_ns
+from rubicon.objc.collections import ObjCListInstance, ObjCListView, _unconverted
 
 PY_LIST = ["one", "two", "three"]
 
@@ -97,6 +101,23 @@ def test_index(make_array):
         a.index("umpteen")
 
 
+@pytest.mark.parametrize(
+    "make_array",
+    [make_ns_array, make_ns_mutable_array],
+)
+def test_index_range(make_array):
+    """The search for an element can be limited to a range of indices."""
+    a = make_array(PY_LIST * 2)
+    assert a.index("one", 1) == 3
+    assert a.index("three", -2) == 5
+    assert a.index("two", 0, 2) == 1
+    assert a.index("two", -5, -3) == 1
+    with pytest.raises(ValueError):
+        a.index("one", 1, 3)
+    with pytest.raises(ValueError):
+        a.index("one", 4, 2)
+
+
 @pytest.mark.parametrize(
     "make_array",
     [make_ns_array, make_ns_mutable_array],
@@ -105,6 +126,13 @@ def test_count(make_array):
     a = make_array(PY_LIST)
     assert a.count("one") == 1
 
+    b = make_array([*PY_LIST, 1, "one", 1.0, 2])
+    assert b.count("one") == 2
+    assert b.count(1) == 2
+    assert b.count("umpteen") == 0
+    assert b.count(None) == 0
+    assert b.count(object()) == 0
+
 
 @pytest.mark.parametrize(
     "make_array",
@@ -137,6 +165,18 @@ def test_slice_access(make_array):
     assert a[:-2] == ["one", "two", "three", "one"]
     assert a[4:] == ["two", "three"]
     assert a[1:5:2] == ["two", "one"]
+    assert a[::-2] == ["three", "one", "two"]
+    assert a[5:0:-3] == ["three", "three"]
+    assert a[4:1:2] == []
+    assert isinstance(a[::2], NSMutableArray)
+
+
+def test_slice_access_large_step():
+    """Extended slices with large steps select the right elements."""
+    a = make_ns_array(list(range(300)))
+    assert py_from_ns(a[::100]) == [0, 100, 200]
+    assert py_from_ns(a[::-100]) == [299, 199, 99]
+    assert py_from_ns(a[5::3]) == list(range(300))[5::3]
 
 
 @pytest.mark.parametrize(
@@ -228,6 +268,21 @@ def test_ns_mutable_array_extend():
     assert "another item" in a
 
 
+def test_ns_mutable_array_extend_iterables():
+    """An array can be extended with any iterable, including an NSArray or itself."""
+    a = make_ns_mutable_array(["one"])
+    a.extend(make_ns_array(["two", "three"]))
+    a.extend(str(n) for n in range(2))
+    assert a == ["one", "two", "three", "0", "1"]
+
+    a.extend(a)
+    assert a == ["one", "two", "three", "0", "1"] * 2
+
+    with pytest.raises(ValueError, match=r"None cannot be stored"):
+        a.extend([None])
+    assert len(a) == 10
+
+
 def test_ns_mutable_array_clear():
     a = make_ns_mutable_array(PY_LIST)
     a.clear()
@@ -285,6 +340,21 @@ def test_ns_mutable_array_slice_assignment3():
     assert a == ["one", "two", "four", "two", "three"]
 
 
+def test_ns_mutable_array_slice_assignment_extended():
+    """Extended slices with negative or large steps can be assigned to."""
+    a = make_ns_mutable_array(PY_LIST * 2)
+    a[::-2] = ["four", "five", "six"]
+    assert a == ["one", "six", "three", "five", "two", "four"]
+
+    a = make_ns_mutable_array(list(range(300)))
+    a[1::100] = ["a", "b", "c"]
+    a[::-150] = ["x", "y"]
+    expected = list(range(300))
+    expected[1::100] = ["a", "b", "c"]
+    expected[::-150] = ["x", "y"]
+    assert py_from_ns(a) == expected
+
+
 def test_ns_mutable_array_bad_slice_assignment1():
     a = make_ns_mutable_array(PY_LIST * 2)
 
@@ -325,6 +395,19 @@ def test_ns_mutable_array_del_slice3():
     assert a[2] == "two"
 
 
+@pytest.mark.parametrize(
+    "item",
+    [slice(1, 250, 3), slice(None, None, 100), slice(299, 0, -70), slice(5, 5, 2)],
+)
+def test_ns_mutable_array_del_slice_extended(item):
+    """Extended slices of any step can be deleted."""
+    a = make_ns_mutable_array(list(range(300)))
+    del a[item]
+    expected = list(range(300))
+    del expected[item]
+    assert py_from_ns(a) == expected
+
+
 def test_ns_mutable_array_reverse():
     a = make_ns_mutable_array(PY_LIST)
     a.reverse()
@@ -454,3 +537,170 @@ def test_python_object_multitype_list_property():
     obj.data = [4, True, "Hello", example]
     assert isinstance(obj.data, ObjCListInstance)
     assert py_from_ns(obj.data) == [4, True, "Hello", example]
+
+
+def test_ns_from_py_list():
+    """A Python list is converted into an NSMutableArray, with all elements converted
+    recursively."""
+    Example = ObjCClass("Example")
+    example = Example.alloc().init()
+
+    array = ns_from_py([1, 2.5, "three", b"four", [5, {"six": 6}], example])
+    assert isinstance(array, NSMutableArray)
+    assert len(array) == 6
+    assert isinstance(array[4], NSMutableArray)
+    assert array[5] is example
+    assert py_from_ns(array) == [1, 2.5, "three", b"four", [5, {"six": 6}], example]
+
+    # Empty lists are converted too.
+    empty = ns_from_py([])
+    assert isinstance(empty, NSMutableArray)
+    assert len(empty) == 0
+
+
+def test_ns_from_py_list_with_none():
+    """A Python list containing None can't be converted to an NSArray."""
+    with pytest.raises(ValueError, match=r"None cannot be stored"):
+        ns_from_py([1, None, 3])
+
+
+@pytest.mark.parametrize(
+    "make_array",
+    [make_ns_array, make_ns_mutable_array],
+)
+def test_py_from_ns(make_array):
+    """An NSArray is converted into a Python list, from a wrapper or a raw
+    pointer."""
+    a = make_array([*PY_LIST, make_array([1, 2])])
+
+    for nsobj in [a, a.ptr]:
+        converted = py_from_ns(nsobj)
+        assert isinstance(converted, list)
+        assert converted == [*PY_LIST, [1, 2]]
+
+    assert py_from_ns(make_array()) == []
+
+
+def test_py_view():
+    """An array can be accessed through a read-only view, which converts elements
+    when they are accessed."""
+    a = make_ns_mutable_array(["one", 2, ["three", 4.5]])
+    view = a.py_view()
+
+    assert isinstance(view, ObjCListView)
+    assert len(view) == 3
+    assert view[0] == "one"
+    assert view[-2] == 2
+    assert view[:2] == ["one", 2]
+    assert "one" in view
+    assert view.index(2) == 1
+    assert list(reversed(view))[1:] == [2, "one"]
+    with pytest.raises(IndexError):
+        view[3]
+
+    # Nested arrays are converted to views too, and converted elements are kept.
+    assert isinstance(view[2], ObjCListView)
+    assert view[2] is view[2]
+    assert view[2] == ["three", 4.5]
+
+    # The view is a snapshot, and can't be modified.
+    a.addObject("five")
+    assert len(view) == 3
+    with pytest.raises(TypeError):
+        view[0] = "uno"
+
+
+def test_py_view_equivalence():
+    """Views can be compared with lists, NSArrays and other views."""
+    a = make_ns_array(PY_LIST)
+    b = make_ns_mutable_array(PY_LIST)
+    view = a.py_view()
+
+    assert view == PY_LIST
+    assert PY_LIST == view
+    assert view == b.py_view()
+    assert view == b
+    assert a == b
+
+    assert view != []
+    assert view != PY_LIST[:2]
+    assert view != ["one", "two", "four"]
+    assert view != tuple(PY_LIST)
+    assert view != object()
+
+    # Comparing views of different lengths doesn't convert any elements, and neither
+    # does comparing elements that are the same objects.
+    assert view != make_ns_array(["one"]).py_view()
+    assert view == make_ns_array(a).py_view()
+    assert all(item is _unconverted for item in view._items)
+
+
+@pytest.mark.parametrize(
+    "typecode, values",
+    [
+        ("b", [-128, 0, 127]),
+        ("H", [0, 1, 65535]),
+        ("i", [-(2**31), 2**31 - 1]),
+        ("q", [-(2**63), 0, 2**63 - 1]),
+        ("Q", [0, 2**64 - 1]),
+        ("f", [0.5, -1.25]),
+        ("d", [0.1, -2.5, 1e300]),
+    ],
+)
+def test_py_array_from_ns(typecode, values):
+    """An NSArray of NSNumbers can be converted into an array.array of any numeric
+    typecode, and back."""
+    nsarray = ns_from_py_array(array.array(typecode, values))
+    assert isinstance(nsarray, NSMutableArray)
+    assert py_from_ns(nsarray) == values
+
+    converted = py_array_from_ns(nsarray, typecode)
+    assert isinstance(converted, array.array)
+    assert converted.typecode == typecode
+    assert converted.tolist() == values
+
+
+def test_py_array_from_ns_infer_typecode():
+    """If no typecode is given, it is chosen from the types of the elements."""
+    assert py_array_from_ns(ns_from_py([1, 2, 3])) == array.array("q", [1, 2, 3])
+    assert py_array_from_ns(ns_from_py([1, 2.5, True])) == array.array(
+        "d", [1.0, 2.5, 1.0]
+    )
+    assert py_array_from_ns(ns_from_py([])) == array.array("q")
+
+    # Unsigned values that don't fit a signed 64-bit integer are kept.
+    converted = py_array_from_ns(ns_from_py_array(array.array("Q", [2**64 - 1])))
+    assert converted == array.array("Q", [2**64 - 1])
+
+
+def test_py_array_from_ns_conversion():
+    """Elements are converted to the requested typecode."""
+    nsarray = ns_from_py([1, 2.75, -3.5, True])
+    assert py_array_from_ns(nsarray, "d").tolist() == [1.0, 2.75, -3.5, 1.0]
+    assert py_array_from_ns(nsarray.ptr, "l").tolist() == [1, 2, -3, 1]
+
+    with pytest.raises(OverflowError):
+        py_array_from_ns(ns_from_py([1000]), "b")
+
+
+def test_py_array_from_ns_invalid():
+    """Only NSArrays of NSNumbers can be converted, to a numeric typecode."""
+    with pytest.raises(TypeError, match=r"containing NSNumbers"):
+        py_array_from_ns(ns_from_py([1, "two"]))
+    with pytest.raises(TypeError, match=r"Only an NSArray or NSData"):
+        py_array_from_ns(ns_from_py("one"))
+    with pytest.raises(ValueError, match=r"Unsupported typecode 'u'"):
+        py_array_from_ns(ns_from_py([1]), "u")
+
+
+def test_ns_from_py_array_buffers():
+    """Multidimensional, non-contiguous and bool buffers can be converted."""
+    values = array.array("i", range(6))
+    assert py_from_ns(ns_from_py_array(memoryview(values)[::2])) == [0, 2, 4]
+    matrix = memoryview(values).cast("B").cast("i", shape=[2, 3])
+    assert py_from_ns(ns_from_py_array(matrix)) == [0, 1, 2, 3, 4, 5]
+    flags = memoryview(bytes([0, 1, 1])).cast("?")
+    assert py_from_ns(ns_from_py_array(flags)) == [False, True, True]
+
+    with pytest.raises(TypeError, match=r"Unsupported buffer format 'c'"):
+        ns_from_py_array(memoryview(b"abc").cast("c"))
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import array
+import gc
+import mmap
+from ctypes import c_int, c_uint8, pointer
+
+import pytest
+
+from rubicon.objc import ObjCClass, ns_from_py, py_from_ns
+from rubicon.objc.api import NSData, ns_from_py_array, py_array_from_ns
+from rubicon.objc.runtime import autoreleasepool, objc_id
+from rubicon.objc.types import NSRange
+
+NSMutableData = ObjCClass("NSMutableData")
+
+
+@pytest.mark.parametrize("no_copy", [False, True])
+@pytest.mark.parametrize(
+    "make_buffer",
+    [
+        lambda data: data,
+        bytearray,
+        memoryview,
+        lambda data: memoryview(data)[2:],
+        lambda data: array.array("B", data),
+    ],
+)
+def test_ns_from_py_buffer(make_buffer, no_copy):
+    """Objects supporting the buffer protocol can be converted to NSData."""
+    pybuffer = make_buffer(b"\x00\x01hello\xff")
+    nsdata = ns_from_py(pybuffer, no_copy=no_copy)
+
+    assert isinstance(nsdata, NSData)
+    assert py_from_ns(nsdata) == bytes(pybuffer)
+
+
+def test_ns_from_py_empty_buffer():
+    """An empty buffer is converted to empty NSData."""
+    assert py_from_ns(ns_from_py(bytearray())) == b""
+    assert py_from_ns(ns_from_py(bytearray(), no_copy=True)) == b""
+
+
+def test_ns_from_py_no_copy_shares_memory():
+    """Converting a buffer without copying shares its memory, and keeps the buffer
+    alive."""
+    pybuffer = bytearray(b"hello")
+    nsdata = ns_from_py(pybuffer, no_copy=True)
+
+    pybuffer[0] = ord("j")
+    assert py_from_ns(nsdata) == b"jello"
+
+    # While the NSData exists, the buffer is exported and can't be resized.
+    with pytest.raises(BufferError):
+        pybuffer.append(0)
+
+    del pybuffer
+    gc.collect()
+    assert py_from_ns(nsdata) == b"jello"
+
+
+def test_ns_from_py_no_copy_mmap():
+    """A memory mapped file can be converted without copying."""
+    mapping = mmap.mmap(-1, 4096)
+    mapping[:5] = b"hello"
+    nsdata = ns_from_py(mapping, no_copy=True)
+
+    assert py_from_ns(nsdata)[:5] == b"hello"
+    assert nsdata.length == 4096
+
+
+def test_ns_from_py_non_contiguous():
+    """Non-contiguous buffers are copied, and can't be converted without copying."""
+    pybuffer = memoryview(b"abcdef")[::2]
+    assert py_from_ns(ns_from_py(pybuffer)) == b"ace"
+
+    with pytest.raises(ValueError, match=r"contiguous"):
+        ns_from_py(pybuffer, no_copy=True)
+
+
+def test_ns_from_py_fortran_contiguous():
+    """Buffers that are contiguous in Fortran order only are copied, and can't be
+    converted without copying."""
+    numpy = pytest.importorskip("numpy")
+    matrix = numpy.arange(6, dtype=numpy.uint8).reshape(2, 3).T
+    assert not memoryview(matrix).c_contiguous
+
+    assert py_from_ns(ns_from_py(matrix)) == bytes([0, 3, 1, 4, 2, 5])
+    with pytest.raises(ValueError, match=r"contiguous"):
+        ns_from_py(matrix, no_copy=True)
+
+
+@pytest.mark.parametrize(
+    "pyobj",
+    [objc_id(0x1234), c_int(42), NSRange(1, 2), (c_uint8 * 4)(), pointer(c_int(1))],
+)
+def test_ns_from_py_ctypes_objects(pyobj):
+    """ctypes objects support the buffer protocol, but aren't converted to NSData."""
+    with pytest.raises(TypeError, match=r"Don't know how to convert"):
+        ns_from_py(pyobj)
+
+
+def test_py_from_ns_no_copy():
+    """NSData can be converted to a read-only memoryview without copying."""
+    with autoreleasepool():
+        nsdata = NSData.dataWithBytes(b"hello", length=5)
+    view = py_from_ns(nsdata, no_copy=True)
+
+    assert isinstance(view, memoryview)
+    assert view.readonly
+    assert view.format == "B"
+    assert view == b"hello"
+    assert bytes(view[1:3]) == b"el"
+
+    # The memoryview keeps the NSData alive.
+    del nsdata
+    gc.collect()
+    assert view.tobytes() == b"hello"
+
+
+def test_py_from_ns_no_copy_empty():
+    """Empty NSData is converted to an empty memoryview."""
+    view = py_from_ns(NSData.data(), no_copy=True)
+    assert isinstance(view, memoryview)
+    assert len(view) == 0
+
+
+def test_py_from_ns_no_copy_mutable():
+    """The memoryview of mutable NSData isn't affected by later changes."""
+    nsdata = NSMutableData.dataWithBytes(b"hello", length=5)
+    view = py_from_ns(nsdata, no_copy=True)
+
+    nsdata.appendBytes(b" world", length=6)
+    assert view == b"hello"
+
+
+def test_py_from_ns_no_copy_other():
+    """no_copy has no effect on objects other than NSData."""
+    assert py_from_ns(ns_from_py("hello"), no_copy=True) == "hello"
+    assert py_from_ns(ns_from_py([b"abc"]), no_copy=True) == [b"abc"]
+
+
+def test_ns_from_py_array_packed():
+    """A buffer of numbers can be converted to packed NSData, and back."""
+    values = array.array("d", [0.5, -1.5, 3.0])
+    nsdata = ns_from_py_array(values, packed=True)
+
+    assert isinstance(nsdata, NSData)
+    assert py_from_ns(nsdata) == values.tobytes()
+    assert py_array_from_ns(nsdata, "d") == values
+    assert py_array_from_ns(NSData.data(), "d") == array.array("d")
+
+    with pytest.raises(TypeError, match=r"typecode is required"):
+        py_array_from_ns(nsdata)
+    with pytest.raises(ValueError, match=r"not a multiple of the item size"):
+        py_array_from_ns(ns_from_py(b"abc"), "i")
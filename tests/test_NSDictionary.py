@@ -7,10 +7,21 @@ from rubicon.objc import (
     NSMutableDictionary,
     NSObject,
     ObjCClass,
+    ns_from_py,
     objc_method,
     objc_property,
+    py_from_ns,
+)
+from rubicon.objc.api import (
+    register_converter_for_objcclass,
+    unregister_converter_for_objcclass,
+)
+from rubicon.objc.collections import (
+    ObjCDictInstance,
+    ObjCDictView,
+    ObjCListView,
+    _unconverted,
 )
-from rubicon.objc.collections import ObjCDictInstance
 
 PY_DICT = {
     "one": "ONE",
@@ -236,6 +247,8 @@ def test_ns_mutable_dictionary_del_missing():
     d = make_ns_mutable_dictionary(PY_DICT)
     with pytest.raises(KeyError):
         del d["four"]
+    with pytest.raises(KeyError):
+        del d[None]
     assert len(d) == 3
 
 
@@ -296,6 +309,7 @@ def test_ns_mutable_dictionary_setdefault1():
 
     assert d.setdefault("one", "default") == "ONE"
     assert len(d) == len(PY_DICT)
+    assert d["one"] == "ONE"
 
 
 def test_ns_mutable_dictionary_setdefault2():
@@ -368,6 +382,37 @@ def test_ns_mutable_dictionary_update4():
     assert len(d) == (len(PY_DICT) + 1)
 
 
+def test_ns_mutable_dictionary_update_nsdictionary():
+    """A dictionary can be updated from an NSDictionary, together with keyword
+    arguments."""
+    d = make_ns_mutable_dictionary(PY_DICT)
+
+    d.update(make_ns_dictionary({"one": "uno", "four": "FOUR"}))
+    assert d == {**PY_DICT, "one": "uno", "four": "FOUR"}
+
+    d.update(make_ns_dictionary({"five": "FIVE"}), six="SIX")
+    assert d["five"] == "FIVE"
+    assert d["six"] == "SIX"
+    assert len(d) == 6
+
+    d.update()
+    assert len(d) == 6
+
+    with pytest.raises(ValueError, match=r"None cannot be stored"):
+        d.update(seven=None)
+    assert "seven" not in d
+
+
+def test_ns_mutable_dictionary_pop_none():
+    """Popping None, which can't be a key, returns the default."""
+    d = make_ns_mutable_dictionary(PY_DICT)
+
+    assert d.pop(None, "default") == "default"
+    with pytest.raises(KeyError):
+        d.pop(None)
+    assert len(d) == 3
+
+
 def test_python_object_primitive_dict_attribute():
     class PrimitiveDictAttrContainer(NSObject):
         @objc_method
@@ -487,3 +532,134 @@ def test_python_object_multitype_dict_property():
     obj.data = {4: 16, True: False, "Hello": "Goodbye"}
     assert obj.data == {4: 16, True: False, "Hello": "Goodbye"}
     assert isinstance(obj.data, ObjCDictInstance)
+
+
+def test_ns_from_py_dict():
+    """A Python dict is converted into an NSMutableDictionary, with all keys and values
+    converted recursively."""
+    dictionary = ns_from_py({"one": 1, 2: [2.5, "three"], "nested": {"four": b"4"}})
+    assert isinstance(dictionary, NSMutableDictionary)
+    assert len(dictionary) == 3
+    assert isinstance(dictionary["nested"], NSMutableDictionary)
+    assert py_from_ns(dictionary) == {
+        "one": 1,
+        2: [2.5, "three"],
+        "nested": {"four": b"4"},
+    }
+
+    # Empty dicts are converted too.
+    empty = ns_from_py({})
+    assert isinstance(empty, NSMutableDictionary)
+    assert len(empty) == 0
+
+
+def test_ns_from_py_dict_with_none():
+    """A Python dict containing None can't be converted to an NSDictionary."""
+    with pytest.raises(ValueError, match=r"None cannot be stored"):
+        ns_from_py({"key": None})
+
+
+@pytest.mark.parametrize(
+    "make_dictionary",
+    [make_ns_dictionary, make_ns_mutable_dictionary],
+)
+def test_py_from_ns(make_dictionary):
+    """An NSDictionary is converted into a Python dict, from a wrapper or a raw
+    pointer."""
+    d = make_dictionary({**PY_DICT, "nested": make_dictionary({"four": 4})})
+
+    for nsobj in [d, d.ptr]:
+        converted = py_from_ns(nsobj)
+        assert isinstance(converted, dict)
+        assert converted == {**PY_DICT, "nested": {"four": 4}}
+
+    assert py_from_ns(make_dictionary()) == {}
+
+
+def test_py_view():
+    """A dictionary can be accessed through a read-only view, which converts values
+    when they are accessed."""
+    d = make_ns_mutable_dictionary({"one": 1, "two": [2, {"three": 3}]})
+    view = d.py_view()
+
+    assert isinstance(view, ObjCDictView)
+    assert len(view) == 2
+    assert "one" in view
+    assert "four" not in view
+    assert sorted(view) == ["one", "two"]
+    assert view["one"] == 1
+    assert view.get("four") is None
+    with pytest.raises(KeyError):
+        view["four"]
+
+    # Nested collections are converted to views too, and converted values are kept.
+    assert isinstance(view["two"], ObjCListView)
+    assert isinstance(view["two"][1], ObjCDictView)
+    assert view["two"] is view["two"]
+    assert dict(view.items()) == {"one": 1, "two": [2, {"three": 3}]}
+
+    # The view is a snapshot, and can't be modified.
+    d["four"] = 4
+    assert len(view) == 2
+    with pytest.raises(TypeError):
+        view["four"] = 4
+
+
+def test_py_view_equivalence():
+    """Views can be compared with dictionaries, NSDictionaries and other views."""
+    d1 = make_ns_dictionary(PY_DICT)
+    d2 = make_ns_mutable_dictionary(PY_DICT)
+    view1 = d1.py_view()
+    view2 = d2.py_view()
+
+    assert view1 == PY_DICT
+    assert PY_DICT == view1
+    assert view1 == view2
+    assert view1 == d2
+    assert d1 == view2
+
+    assert view1 != {}
+    assert view1 != {**PY_DICT, "one": "uno"}
+    assert view1 != {**PY_DICT, "four": "FOUR"}
+    assert view1 != make_ns_dictionary({"one": "ONE"}).py_view()
+    assert view1 != object()
+
+
+def test_py_view_custom_converter():
+    """Nested collections are converted using the converter registered for their
+    class, if it isn't the built-in one."""
+    d = make_ns_dictionary({"one": make_ns_dictionary({"two": 2})})
+
+    register_converter_for_objcclass(lambda ptr: "custom", NSMutableDictionary)
+    try:
+        assert d.py_view()["one"] == "custom"
+    finally:
+        unregister_converter_for_objcclass(NSMutableDictionary)
+
+    assert isinstance(d.py_view()["one"], ObjCDictView)
+
+
+def test_eq_mapping_length(monkeypatch):
+    """Comparing a dictionary with a mapping of a different length doesn't create a
+    view."""
+
+    def py_view(self):
+        raise AssertionError("py_view() should not be called")
+
+    d = make_ns_dictionary(PY_DICT)
+    monkeypatch.setattr(ObjCDictInstance, "py_view", py_view)
+    assert d != {"one": "ONE"}
+
+
+def test_py_view_lazy():
+    """Comparing views doesn't convert values if the lengths differ, or if the values
+    are the same objects."""
+    d = make_ns_dictionary(PY_DICT)
+    view = d.py_view()
+    assert view != {"one": "ONE"}
+    assert view != make_ns_dictionary({"one": "ONE"}).py_view()
+    assert view == make_ns_dictionary(d).py_view()
+    assert all(item is _unconverted for item in view._items)
+
+    assert view["one"] == "ONE"
+    assert view._items.count(_unconverted) == len(PY_DICT) - 1
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import gc
 import operator
 import os
 
 import pytest
 
-from rubicon.objc import ns_from_py, py_from_ns
+import rubicon.objc.api
+from rubicon.objc import ns_from_py, objc_method, py_from_ns
 from rubicon.objc.api import NSString
+from rubicon.objc.runtime import libobjc
+from rubicon.objc.types import NSUInteger, unichar
 
 TEST_STRINGS = ("", "abcdef", "zyxwvu", "Uñîçö∂€")
 HAYSTACK = "abcdabcdabcdef"
@@ -15,6 +19,24 @@ RANGES = [(None, None), (None, 6), (6, None), (4, 10)]
 NON_STRINGS = (42, 4.2, None, [1, 2], object())
 
 
+class UTF16String(NSString):
+    """An NSString subclass that doesn't expose its contents as a buffer, so that
+    they have to be copied out with getCharacters:range:."""
+
+    @objc_method
+    def length(self) -> NSUInteger:
+        return len(self.units)
+
+    @objc_method
+    def characterAtIndex_(self, index: NSUInteger) -> unichar:
+        return self.units[index]
+
+
+def utf16_units(pystr):
+    data = pystr.encode("utf-16-le", "surrogatepass")
+    return [int.from_bytes(data[i : i + 2], "little") for i in range(0, len(data), 2)]
+
+
 def assert_method(py_value, method, *args, **kwargs):
     ns_value = ns_from_py(py_value)
 
@@ -77,6 +99,86 @@ def test_str_nsstring_conversion(pystr):
     assert py_from_ns(nsstr) == pystr
 
 
+@pytest.mark.parametrize(
+    "pystr",
+    [
+        "a\x00b",
+        "\U0001f600 smiley",
+        "lone \ud800 surrogate",
+        "x" * 200_000 + "ñ",
+    ],
+)
+def test_str_nsstring_characters(pystr):
+    """NSStrings with any UTF-16 contents are converted to str."""
+    units = utf16_units(pystr)
+    nsstr = NSString.stringWithCharacters(
+        (unichar * len(units))(*units), length=len(units)
+    )
+    assert str(nsstr) == pystr
+    assert py_from_ns(nsstr) == pystr
+
+
+@pytest.mark.parametrize("no_copy", [False, True])
+@pytest.mark.parametrize(
+    "pystr",
+    [
+        "",
+        "plain ASCII",
+        "Latin-1: ñîçö",
+        "a\x00b",
+        "BMP: ∂€ 世界",
+        "astral: \U0001f600",
+        "lone \ud800 surrogate",
+        "ASCII " * 1000,
+        "Latin-1 ñ " * 1000,
+        "astral \U0001f600 " * 1000,
+        "lone \ud800 surrogate " * 1000,
+    ],
+)
+def test_ns_from_py_str(pystr, no_copy):
+    """Any str can be converted to NSString, with or without copying."""
+    nsstr = ns_from_py(pystr, no_copy=no_copy)
+    assert isinstance(nsstr, NSString)
+    assert nsstr.length == len(pystr.encode("utf-16-le", "surrogatepass")) // 2
+    assert str(nsstr) == pystr
+
+
+def test_ns_from_py_str_no_copy_keeps_alive():
+    """A str converted without copying is kept alive by the NSString."""
+    nsstr = ns_from_py("".join(["kept alive "] * 1000), no_copy=True)
+    gc.collect()
+    assert str(nsstr) == "kept alive " * 1000
+
+
+@pytest.mark.parametrize(
+    "pystr, shared",
+    [
+        ("ASCII " * 1000, True),
+        ("ASCII", False),
+        ("Latin-1 ñ " * 1000, False),
+        ("astral \U0001f600 " * 1000, False),
+    ],
+)
+def test_ns_from_py_str_no_copy_shared(pystr, shared):
+    """Only long ASCII strs share their memory with the NSString."""
+    nsstr = ns_from_py(pystr, no_copy=True)
+    key = rubicon.objc.api._no_copy_buffer_key
+    assert (libobjc.objc_getAssociatedObject(nsstr, key).value is not None) == shared
+    assert str(nsstr) == pystr
+
+
+@pytest.mark.parametrize("chunk_length", [1, 3, 1024])
+def test_str_nsstring_copied(monkeypatch, chunk_length):
+    """NSStrings without an accessible buffer are copied out in chunks, including
+    surrogate pairs that are split between chunks."""
+    monkeypatch.setattr(rubicon.objc.api, "_NSSTRING_CHUNK_LENGTH", chunk_length)
+    pystr = "ab\U0001f600cd\ud800e"
+    nsstr = UTF16String.alloc().init()
+    nsstr.units = utf16_units(pystr)
+    assert str(nsstr) == pystr
+    assert py_from_ns(nsstr) == pystr
+
+
 def test_nsstring_eq_nsstring():
     """Two NSStrings can be checked for equality."""
     first = ns_from_py("first")
@@ -23,6 +23,8 @@ from rubicon.objc import (
     objc_property,
 )
 from rubicon.objc.runtime import (
+    SEL,
+    add_method,
     autoreleasepool,
     get_ivar,
     libobjc,
@@ -509,3 +511,138 @@ def test_property_forcing():
     assert not callable(NSBundle.mainBundle), (
         "NSBundle.mainBundle should not be a method"
     )
+
+
+def test_property_forcing_after_access():
+    """A method can be declared as a property after it has been accessed as a
+    method."""
+
+    class LateProperty(NSObject):
+        @objc_method
+        def answer(self) -> c_int:
+            return 42
+
+    class LatePropertySubclass(LateProperty):
+        pass
+
+    obj = LateProperty.new()
+    subobj = LatePropertySubclass.new()
+
+    # Accessing the method caches how the attribute was resolved.
+    assert obj.answer() == 42
+    assert subobj.answer() == 42
+
+    LateProperty.declare_property("answer")
+
+    # The declaration takes effect on the class and its subclasses.
+    assert obj.answer == 42
+    assert subobj.answer == 42
+
+
+def test_method_added_at_runtime():
+    """A method added to a class after it has been used can be called."""
+
+    class LateMethods(NSObject):
+        pass
+
+    class LateMethodsSubclass(LateMethods):
+        pass
+
+    class UnrelatedMethods(NSObject):
+        pass
+
+    obj = LateMethods.new()
+    subobj = LateMethodsSubclass.new()
+    unrelated = UnrelatedMethods.new()
+    assert str(unrelated.description)
+
+    # Neither instance has the method yet, and the failed lookup is cached.
+    with pytest.raises(AttributeError):
+        obj.addedLater()
+    with pytest.raises(AttributeError):
+        subobj.addedLater()
+
+    def addedLater(self, cmd) -> c_int:
+        return 37
+
+    add_method(LateMethods, "addedLater", addedLater, [c_int, objc_id, SEL])
+
+    assert obj.addedLater() == 37
+    assert subobj.addedLater() == 37
+    # Classes that don't inherit from the changed class keep their caches.
+    assert "description" in UnrelatedMethods.resolved_attributes
+
+
+def test_lazy_method_resolution():
+    """Methods and partial methods are resolved one name at a time, and shared with
+    subclasses that don't override them."""
+
+    class LazyBase(NSObject):
+        @objc_method
+        def greet_(self, value: int) -> int:
+            return value
+
+        @objc_method
+        def greet_times_(self, value: int, times: int) -> int:
+            return value * times
+
+    class LazySubclass(LazyBase):
+        @objc_method
+        def farewell(self) -> int:
+            return 2
+
+    obj = LazySubclass.new()
+
+    # Calling a method with its full name only looks up that method.
+    assert obj.greet_times_(3, 4) == 12
+    assert "greet:times:" in LazySubclass.instance_methods
+    assert "greet:" not in LazySubclass.instance_methods
+    assert "greet" not in LazySubclass.partial_methods
+    assert "greet_times_" not in LazySubclass.partial_methods
+    # No class in the hierarchy had to list its methods.
+    assert LazySubclass.method_names is None
+    assert LazyBase.method_names is None
+
+    # A partial method only defined on the superclass is shared by the subclass.
+    assert obj.greet(3) == 3
+    assert obj.greet(3, times=5) == 15
+    partial = LazySubclass.partial_methods["greet"]
+    assert partial is LazyBase.partial_methods["greet"]
+    assert "farewell" not in LazyBase.partial_methods
+
+    assert obj.farewell() == 2
+
+
+def test_partial_method_layers():
+    """A partial method only stores the methods added by its class, and finds the
+    inherited ones through the superclass."""
+
+    class LayerBase(NSObject):
+        @objc_method
+        def combine_(self, value: int) -> int:
+            return value
+
+        @objc_method
+        def combine_plus_(self, value: int, other: int) -> int:
+            return value + other
+
+    class LayerSubclass(LayerBase):
+        @objc_method
+        def combine_plus_(self, value: int, other: int) -> int:
+            return value - other
+
+        @objc_method
+        def combine_times_(self, value: int, times: int) -> int:
+            return value * times
+
+    obj = LayerSubclass.new()
+    assert obj.combine(5) == 5
+    assert obj.combine(5, plus=3) == 2
+    assert obj.combine(5, times=3) == 15
+
+    partial = LayerSubclass.partial_methods["combine"]
+    assert partial.superpartial is LayerBase.partial_methods["combine"]
+    assert partial.methods == {("", "times"): "combine:times:"}
+
+    with pytest.raises(ValueError, match=r"Invalid selector combine:other:"):
+        obj.combine(5, other=3)
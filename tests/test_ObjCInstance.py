@@ -10,14 +10,31 @@ import pytest
 from rubicon.objc import (
     NSMutableArray,
     NSObject,
+    NSUInteger,
     ObjCClass,
     ObjCInstance,
     ObjCMetaClass,
     ObjCProtocol,
+    ns_from_py,
     objc_method,
     objc_property,
+    py_from_ns,
+)
+from rubicon.objc.api import (
+    converter_for_objcclass,
+    get_converter_for_objcclass_map,
+    register_converter_for_objcclass,
+    unregister_converter_for_objcclass,
+)
+from rubicon.objc.runtime import (
+    autoreleasepool,
+    disable_deferred_releases,
+    enable_deferred_releases,
+    flush_deferred_releases,
+    libobjc,
+    objc_id,
+    send_message,
 )
-from rubicon.objc.runtime import autoreleasepool, libobjc
 
 from .conftest import (
     NSImage,
@@ -374,6 +391,83 @@ def test_dealloc():
     assert attr1.retainCount() == 1, "weak property value was released"
 
 
+def retain_count(ptr):
+    return send_message(ptr, "retainCount", restype=NSUInteger, argtypes=[])
+
+
+def test_deferred_release():
+    """With deferred releases enabled, objects are released when the queue is
+    flushed."""
+    enable_deferred_releases()
+    try:
+        obj = NSObject.new()
+        ptr = objc_id(obj.ptr.value)
+        # Keep the object alive after it has been released.
+        libobjc.objc_retain(ptr)
+        assert retain_count(ptr) == 2
+
+        del obj
+        gc.collect()
+        assert retain_count(ptr) == 2
+
+        # Flushing autoreleases the objects into the current pool.
+        with autoreleasepool():
+            flush_deferred_releases()
+            assert retain_count(ptr) == 2
+        assert retain_count(ptr) == 1
+
+        # Exiting an autorelease pool also flushes the queue.
+        obj = ObjCInstance(ptr)
+        assert retain_count(ptr) == 2
+        with autoreleasepool():
+            del obj
+            gc.collect()
+            assert retain_count(ptr) == 2
+        assert retain_count(ptr) == 1
+
+        # Disabling deferred releases flushes the queue too.
+        obj = ObjCInstance(ptr)
+        del obj
+        gc.collect()
+        with autoreleasepool():
+            disable_deferred_releases()
+        assert retain_count(ptr) == 1
+    finally:
+        disable_deferred_releases()
+
+    libobjc.objc_release(ptr)
+
+
+def test_deferred_release_during_pool():
+    """An object that is only owned by its wrapper isn't deallocated by flushing the
+    deferred release queue before the current autorelease pool is drained."""
+
+    class DeferredDeallocTester(NSObject):
+        did_dealloc = False
+
+        @objc_method
+        def dealloc(self):
+            DeferredDeallocTester.did_dealloc = True
+
+    enable_deferred_releases()
+    try:
+        with autoreleasepool():
+            # As when a factory method returns a new object to Objective-C, the
+            # wrapper holds the only reference to the object.
+            obj = DeferredDeallocTester.alloc().init()
+            ptr = objc_id(obj.ptr.value)
+            del obj
+            gc.collect()
+
+            flush_deferred_releases()
+            assert not DeferredDeallocTester.did_dealloc
+            assert retain_count(ptr) == 1
+
+        assert DeferredDeallocTester.did_dealloc
+    finally:
+        disable_deferred_releases()
+
+
 def test_polymorphic_constructor():
     """Check that the right constructor is activated based on arguments used."""
     Example = ObjCClass("Example")
@@ -394,3 +488,33 @@ def test_polymorphic_constructor():
     # Protected constructors can't be invoked
     with pytest.raises(AttributeError):
         Example.alloc().initWithString_("Hello")
+
+
+def test_custom_converter():
+    """A converter registered for a class is used by py_from_ns for instances of the
+    class and its subclasses."""
+    Example = ObjCClass("Example")
+    SpecificExample = ObjCClass("SpecificExample")
+
+    def convert_example(ptr):
+        return ("example", ObjCInstance(ptr).intField)
+
+    obj = SpecificExample.alloc().initWithIntValue_(42)
+    assert converter_for_objcclass(SpecificExample) is None
+
+    register_converter_for_objcclass(convert_example, Example)
+    try:
+        assert converter_for_objcclass(Example) is convert_example
+        assert converter_for_objcclass(SpecificExample) is convert_example
+        assert get_converter_for_objcclass_map()[Example.ptr.value] is convert_example
+
+        assert py_from_ns(obj) == ("example", 42)
+        # Converters are also used for the contents of collections.
+        assert py_from_ns(ns_from_py([obj, 1])) == [("example", 42), 1]
+        assert list(ns_from_py([obj, 1]).py_view()) == [("example", 42), 1]
+    finally:
+        unregister_converter_for_objcclass(Example)
+
+    assert converter_for_objcclass(SpecificExample) is None
+    assert Example.ptr.value not in get_converter_for_objcclass_map()
+    assert py_from_ns(obj) is obj
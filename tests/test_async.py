@@ -176,6 +176,42 @@ def test_subprocess(loop):
     assert ({"README.md"} - task.result()) == set()
 
 
+def test_autorelease_pool_per_callback(loop):
+    """By default, every callback runs in its own autorelease pool."""
+    results = []
+    loop.run_until_complete(do_stuff(results, 3))
+
+    metrics = loop.autorelease_metrics
+    assert metrics.pools >= 3
+    assert metrics.callbacks == metrics.pools
+    assert metrics.max_callbacks == 1
+
+
+def test_autorelease_pool_shared(loop):
+    """Callbacks can share an autorelease pool."""
+    loop.set_autorelease_policy(callbacks=None, interval=10)
+
+    results = []
+    for i in range(100):
+        loop.call_soon(results.append, i)
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+
+    assert results == list(range(100))
+    metrics = loop.autorelease_metrics
+    assert metrics.callbacks >= 101
+    assert metrics.max_callbacks > 1
+    assert metrics.pools < metrics.callbacks
+
+
+def test_autorelease_policy_invalid(loop):
+    """The autorelease pool policy is validated."""
+    with pytest.raises(ValueError, match=r"callbacks must be at least 1"):
+        loop.set_autorelease_policy(callbacks=0)
+    with pytest.raises(ValueError, match=r"interval must be positive"):
+        loop.set_autorelease_policy(interval=0)
+
+
 def test_cf_lifecycle(loop):
     """The simple CFLifecycle works."""
     loop.create_task(stop_loop(loop, 0.6))
@@ -76,6 +76,38 @@ def test_incorrect_argument_count():
     with pytest.raises(TypeError):
         obj.mutateIntFieldWithValue_(123, "extra argument")
 
+    with pytest.raises(
+        TypeError,
+        match=r"Method b'mutateIntFieldWithValue:' takes 1 arguments, but got 2",
+    ):
+        obj.mutateIntFieldWithValue_(123, "extra argument")
+
+
+def test_invalid_receiver():
+    """Calling a method on something that isn't an Objective-C object throws an
+    exception."""
+    method = NSObject.new().description.method
+
+    with pytest.raises(TypeError, match=r"Receiver must be an ObjCInstance or objc_id"):
+        method("not an object")
+
+
+def test_repeated_calls():
+    """A method can be called repeatedly with arguments that need converting."""
+    Example = ObjCClass("Example")
+
+    for value in range(3):
+        ret = Example.extractSimpleStruct(
+            ([9, 8, 7, 6], None, (value, value + 1), None)
+        )
+        assert ret.field_0 == value
+        assert ret.field_1 == value + 1
+
+    obj = Example.alloc().init()
+    for value in range(3):
+        obj.mutateIntFieldWithValue_(value)
+        assert obj.accessIntField() == value
+
 
 def test_incorrect_argument_type():
     """Attempting to call a method with the wrong type of argument throws an
@@ -125,6 +157,16 @@ def test_str_repr():
     assert str(obj.performSelector.method) == "ObjCPartialMethod('performSelector')"
 
 
+def test_method_objects_slots():
+    """Method wrappers don't have a per-instance __dict__."""
+    obj = NSObject.new()
+
+    for method in [obj.init, obj.init.method, obj.performSelector.method]:
+        assert not hasattr(method, "__dict__")
+        with pytest.raises(AttributeError):
+            method.extra = 42
+
+
 def test_float_method():
     """A method with a float argument can be handled."""
     Example = ObjCClass("Example")
@@ -264,6 +306,27 @@ def test_number_return():
     assert py_from_ns(tau) == pytest.approx(2.0 * math.pi)
 
 
+@pytest.mark.parametrize(
+    "value",
+    [True, False, 0, -1, 42, 2**63 - 1, 2**64 - 1, -(2**63), 0.5, -2.5, math.inf],
+)
+def test_number_conversion(value):
+    """NSNumbers are converted to a Python number of the matching type."""
+    NSNumber = ObjCClass("NSNumber")
+    if isinstance(value, bool):
+        number = NSNumber.numberWithBool(value)
+    elif isinstance(value, float):
+        number = NSNumber.numberWithDouble(value)
+    elif value >= 2**63:
+        number = NSNumber.numberWithUnsignedLongLong(value)
+    else:
+        number = NSNumber.numberWithLongLong(value)
+
+    converted = py_from_ns(number)
+    assert converted == value
+    assert type(converted) is type(value)
+
+
 def test_auto_struct_creation():
     """Structs from method signatures are created automatically."""
     Example = ObjCClass("Example")
@@ -30,6 +30,14 @@ def test_sel_by_name():
     assert SEL(b"foobar").name == b"foobar"
 
 
+def test_sel_interned():
+    """Selectors created from the same name are the same object."""
+    assert SEL("foobarInterned") is SEL("foobarInterned")
+    assert SEL(b"foobarInterned") is SEL(b"foobarInterned")
+    assert SEL("foobarInterned").value == SEL(b"foobarInterned").value
+    assert SEL("foobarInterned").name == b"foobarInterned"
+
+
 def test_sel_null():
     with pytest.raises(ValueError):
         _ = SEL(None).name
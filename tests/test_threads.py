@@ -62,12 +62,12 @@ def test_method_cache():
         # Manually clear the method/property cache on Example.
         # This returns the attributes set in ObjCClass.__new__
         # to their initial values.
-        Example.methods_ptr = None
-        Example.instance_method_ptrs = {}
+        Example.method_names = None
         Example.instance_methods = {}
         Example.instance_properties = {}
         Example.forced_properties = set()
         Example.partial_methods = {}
+        Example.resolved_attributes = {}
 
         # A worker method that invokes a method.
         # This will also populate the method cache.
@@ -96,12 +96,12 @@ def test_accessor_cache():
         # Manually clear the method/property cache on Example.
         # This returns the attributes set in ObjCClass.__new__
         # to their initial values.
-        Example.methods_ptr = None
-        Example.instance_method_ptrs = {}
+        Example.method_names = None
         Example.instance_methods = {}
         Example.instance_properties = {}
         Example.forced_properties = set()
         Example.partial_methods = {}
+        Example.resolved_attributes = {}
 
         # A worker method that accesses a property
         # This will also populate the property cache.
@@ -130,12 +130,12 @@ def test_mutator_cache():
         # Manually clear the method/property cache on Example.
         # This returns the attributes set in ObjCClass.__new__
         # to their initial values.
-        Example.methods_ptr = None
-        Example.instance_method_ptrs = {}
+        Example.method_names = None
         Example.instance_methods = {}
         Example.instance_properties = {}
         Example.forced_properties = set()
         Example.partial_methods = {}
+        Example.resolved_attributes = {}
 
         # A worker method that mutates a property
         # This will also populate the property cache.
@@ -151,3 +151,85 @@ def test_mutator_cache():
         thread.start()
         work()
         thread.join()
+
+
+def test_cache_hits_without_lock():
+    """Once methods and properties have been cached, using them doesn't need the
+    class's cache lock."""
+    Example = ObjCClass("Example")
+    obj = Example.alloc().init()
+
+    # Populate the caches.
+    obj.mutateIntFieldWithValue(1)
+    obj.intField = 2
+    _ = obj.intField
+
+    locked = threading.Event()
+    release = threading.Event()
+
+    # Hold the cache lock in another thread.
+    def hold_lock():
+        with Example.cache_lock:
+            locked.set()
+            release.wait()
+
+    results = []
+
+    def work():
+        obj.mutateIntFieldWithValue(42)
+        results.append(obj.intField)
+        obj.intField = 37
+        results.append(obj.intField)
+
+    lock_thread = threading.Thread(target=hold_lock)
+    lock_thread.start()
+    locked.wait()
+    try:
+        thread = threading.Thread(target=work)
+        thread.start()
+        # If the cache hits needed the lock, the thread would still be blocked.
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+        assert results == [42, 37]
+    finally:
+        release.set()
+        lock_thread.join()
+        thread.join()
+
+
+def test_wrapper_cache_hits_without_lock():
+    """Wrapping an object that already has a wrapper doesn't need the instance
+    lock."""
+    Example = ObjCClass("Example")
+    obj = Example.alloc().init()
+    ptr = obj.ptr
+
+    locked = threading.Event()
+    release = threading.Event()
+
+    # Hold the instance lock in another thread.
+    def hold_lock():
+        with ObjCInstance._instance_lock:
+            locked.set()
+            release.wait()
+
+    results = []
+
+    def work():
+        results.append(ObjCInstance(ptr))
+
+    lock_thread = threading.Thread(target=hold_lock)
+    lock_thread.start()
+    locked.wait()
+    try:
+        thread = threading.Thread(target=work)
+        thread.start()
+        # If the cache hit needed the lock, the thread would still be blocked.
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+        assert results == [obj]
+        assert results[0] is obj
+    finally:
+        release.set()
+        lock_thread.join()
+        thread.join()
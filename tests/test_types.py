@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from ctypes import c_void_p
+
+import pytest
+
 from rubicon.objc import (
     CFRange,
     CGPoint,
@@ -13,7 +17,18 @@ from rubicon.objc import (
     NSSize,
     UIEdgeInsets,
 )
-from rubicon.objc.types import __LP64__
+from rubicon.objc.runtime import SEL, objc_id
+from rubicon.objc.types import (
+    __LP64__,
+    _ctypes_for_method_encoding,
+    ctypes_for_method_encoding,
+    get_encoding_for_ctype_map,
+    register_encoding,
+    register_preferred_encoding,
+    split_method_encoding,
+    unregister_ctype,
+    unregister_encoding_all,
+)
 
 
 def test_nspoint_repr():
@@ -109,3 +124,85 @@ def test_function_NSEdgeInsetsMake():
     assert insets.left == other_insets.left
     assert insets.bottom == other_insets.bottom
     assert insets.right == other_insets.right
+
+
+def test_split_method_encoding():
+    """Method encodings are split into their type encodings, ignoring stack
+    offsets."""
+    assert split_method_encoding(b"v16@0:8") == [b"v", b"@", b":"]
+    assert split_method_encoding(b"{CGRect={CGPoint=dd}{CGSize=dd}}24@0:8Q16") == [
+        b"{CGRect={CGPoint=dd}{CGSize=dd}}",
+        b"@",
+        b":",
+        b"Q",
+    ]
+    assert split_method_encoding(b'v32@0:8@?<v@?@>16@"NSString"24') == [
+        b"v",
+        b"@",
+        b":",
+        b"@?<v@?@>",
+        b'@"NSString"',
+    ]
+    assert split_method_encoding(b"r*16@0:8^{_NSZone=}16") == [
+        b"r*",
+        b"@",
+        b":",
+        b"^{_NSZone=}",
+    ]
+
+    with pytest.raises(ValueError, match=r"Unknown encoding b'%' at index 1"):
+        split_method_encoding(b"v%")
+    with pytest.raises(ValueError, match=r"missing 1 closing parentheses"):
+        split_method_encoding(b"{CGPoint=dd")
+
+
+def test_ctypes_for_method_encoding_cache():
+    """Cached method encoding conversions are updated when the encoding registrations
+    change."""
+    encoding = b"@16@0:8"
+    restype, *argtypes = ctypes_for_method_encoding(encoding)
+    assert restype is objc_id
+    assert argtypes == [objc_id, SEL]
+
+    # Each call returns a new list.
+    assert ctypes_for_method_encoding(encoding) is not ctypes_for_method_encoding(
+        encoding
+    )
+
+    class custom_id(c_void_p):
+        pass
+
+    register_preferred_encoding(b"@", custom_id)
+    try:
+        assert ctypes_for_method_encoding(encoding) == [custom_id, custom_id, SEL]
+    finally:
+        register_preferred_encoding(b"@", objc_id)
+        unregister_ctype(custom_id)
+
+    assert ctypes_for_method_encoding(encoding) == [objc_id, objc_id, SEL]
+    assert custom_id not in get_encoding_for_ctype_map()
+
+
+def test_ctypes_for_method_encoding_cache_kept():
+    """Registering encodings that no cached conversion can depend on, like the
+    structures created while parsing, doesn't clear the cache."""
+    ctypes_for_method_encoding(b"v16@0:8")
+    cached = _ctypes_for_method_encoding.cache_info().currsize
+    assert cached > 0
+
+    ctypes_for_method_encoding(b"v24@0:8{CacheKeptStruct=ii}16")
+    assert _ctypes_for_method_encoding.cache_info().currsize == cached + 1
+
+    # An object encoding with a class name is parsed as a plain object, so
+    # registering one can change cached results.
+    class custom_id(c_void_p):
+        pass
+
+    encoding = b'v24@0:8@"CacheKeptClass"16'
+    assert ctypes_for_method_encoding(encoding)[-1] is objc_id
+    register_encoding(b'@"CacheKeptClass"', custom_id)
+    try:
+        assert ctypes_for_method_encoding(encoding)[-1] is custom_id
+    finally:
+        unregister_encoding_all(b'@"CacheKeptClass"')
+    assert ctypes_for_method_encoding(encoding)[-1] is objc_id